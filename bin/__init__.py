@@ -1,12 +1,17 @@
 from .aget import *
+from .cache import *
+from .config import *
 from .enums import *
 from .database import *
 from .launchlibrary2 import *
+from .ll2_changes import *
 from .minutes import *
 from .nasatv import *
 from .notification_check import *
+from .runner import *
 from .snapi import *
 from .strings import *
+from .webhooks import *
 from .youtube_api import *
 from .youtube_rss import *
 from .youtube_id import *
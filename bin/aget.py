@@ -1,11 +1,152 @@
 import aiohttp
+from types import TracebackType
+from typing import Self
+
+class _NotModified:
+    """
+    Returned by `get` when a conditional
+    request's content did not change.
+    """
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return 'NOT_MODIFIED'
+
+NOT_MODIFIED = _NotModified()
+
+class SharedSession:
+    """
+    Long-lived aiohttp client session with a
+    tuned connection pool, shared by every
+    outbound HTTP request of LiveLaunch.
+
+    Notes
+    -----
+    Call the object to get the underlying
+    `aiohttp.ClientSession`, it is created
+    lazily within the running event loop.
+
+    Examples
+    --------
+    >>> async with shared_session:
+    ...    webhook = Webhook.from_url(url, session=shared_session())
+    """
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 25,
+        keepalive_timeout: float = 60,
+        ttl_dns_cache: int = 300,
+        timeout: float = 30,
+        validators_size: int = 256
+    ) -> None:
+        """
+        Parameters
+        ----------
+        limit : int, default: 100
+            Total amount of simultaneous connections.
+        limit_per_host : int, default: 25
+            Amount of simultaneous connections per host,
+            also the ceiling of webhook fan-outs since
+            every webhook is sent to discord.com.
+        keepalive_timeout : float, default: 60
+            Seconds to keep idle connections open.
+        ttl_dns_cache : int, default: 300
+            Seconds to cache DNS lookups.
+        timeout : float, default: 30
+            Total timeout of a request in seconds.
+        validators_size : int, default: 256
+            Amount of URLs to keep the validators of
+            for conditional requests, oldest first out.
+        """
+        self.limit_per_host = limit_per_host
+        self._connector_settings = {
+            'limit': limit,
+            'limit_per_host': limit_per_host,
+            'keepalive_timeout': keepalive_timeout,
+            'ttl_dns_cache': ttl_dns_cache
+        }
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        # Trace configs to attach, add them before the first request
+        self.trace_configs: list[aiohttp.TraceConfig] = []
+        # URL: (ETag, Last-Modified) of the last conditional response
+        self.validators: dict[str, tuple[str | None, str | None]] = {}
+        self.validators_size = validators_size
+        self._session = None
+
+    def __call__(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session, creates
+        a new one when it doesn't exist
+        yet or has been closed.
+
+        Returns
+        -------
+        session : aiohttp.ClientSession
+            Shared client session.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    **self._connector_settings
+                ),
+                timeout=self._timeout,
+                trace_configs=self.trace_configs or None
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the shared session and its connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> Self:
+        """
+        Enter asynchronous context manager.
+
+        Returns
+        -------
+        self : SharedSession
+            Returns self.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[Exception] | None,
+        exc_value: Exception | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """
+        Exit asynchronous context manager.
+        Closes the shared session.
+
+        Parameters
+        ----------
+        exc_type : type[Exception] or None
+            Exception type.
+        exc_value : Exception or None
+            Exception value.
+        traceback : TracebackType or None
+            Exception traceback.
+        """
+        await self.close()
+
+# Session shared by the bot, its cogs and `get`
+shared_session = SharedSession()
 
 async def get(
     url: str,
     *,
     headers: dict[str, str] = None,
-    json: bool = False
-) -> str or dict:
+    json: bool = False,
+    conditional: bool = False
+) -> str or dict or _NotModified:
     """
     Use aiohttp to get the contents of
     a webpage or API asynchronously.
@@ -18,18 +159,50 @@ async def get(
         Request header dictionary.
     json : bool, default: False
         Whether to return a json instead of text.
+    conditional : bool, default: False
+        Send the ETag and Last-Modified validators
+        of the previous response of this URL and
+        return `NOT_MODIFIED` when it didn't change.
 
     Returns
     -------
-    response : str or dict
+    response : str or dict or NOT_MODIFIED
         Response data in a form of a string or dictionairy
-        depending on the json parameter.
+        depending on the json parameter, `NOT_MODIFIED`
+        when a conditional request did not change.
+
+    Notes
+    -----
+    Uses the `shared_session` connection pool.
     """
-    async with (
-        aiohttp.ClientSession() as session,
-        session.get(url, headers=headers) as response
-    ):
+    if conditional:
+        headers = dict(headers or {})
+        etag, last_modified = shared_session.validators.get(url, (None, None))
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+    async with shared_session().get(url, headers=headers) as response:
+        if conditional and response.status == 304:
+            return NOT_MODIFIED
+
         if json:
-            return await response.json()
+            data = await response.json()
         else:
-            return await response.text()
+            data = await response.text()
+
+        # Store validators once the new content has been read
+        if conditional and response.status == 200:
+            validators = (
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified')
+            )
+            shared_session.validators.pop(url, None)
+            if any(validators):
+                # Only keep the validators of the most recent URLs
+                shared_session.validators[url] = validators
+                while len(shared_session.validators) > shared_session.validators_size:
+                    del shared_session.validators[next(iter(shared_session.validators))]
+
+        return data
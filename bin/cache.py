@@ -0,0 +1,130 @@
+import asyncio
+from collections import OrderedDict
+import json
+import logging
+import os
+from time import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+class TTLCache:
+    """
+    Bounded least recently used cache
+    with expiring entries, None values
+    are cached as failures with their
+    own (usually shorter) lifetime.
+
+    Notes
+    -----
+    Check with `key in cache` before getting an
+    item, expired entries stay available through
+    `.get_stale()` until they are evicted.
+    """
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 86400,
+        negative_ttl: float = 300,
+        path: str | None = None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        maxsize : int, default: 1024
+            Maximum amount of entries.
+        ttl : float, default: 86400
+            Seconds an entry is kept.
+        negative_ttl : float, default: 300
+            Seconds a None entry is kept.
+        path : str or None, default: None
+            JSON file to persist entries
+            to, when None nothing is stored.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.path = path
+        # Key: (expiry timestamp, value)
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._load()
+
+    def __contains__(self, key: str) -> bool:
+        if (entry := self._data.get(key)) is None:
+            return False
+        # Expired entries are not contained
+        return entry[0] > time()
+
+    def __getitem__(self, key: str) -> Any:
+        entry = self._data[key]
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        ttl = self.negative_ttl if value is None else self.ttl
+        self._data[key] = (time() + ttl, value)
+        self._data.move_to_end(key)
+        # Remove least recently used entries
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_stale(self, key: str) -> Any:
+        """
+        Get a value even when it has expired.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+
+        Returns
+        -------
+        value : Any
+            Stored value or None when there is none.
+        """
+        if (entry := self._data.get(key)) is None:
+            return None
+        return entry[1]
+
+    def _load(self) -> None:
+        """
+        Load the persisted entries that
+        haven't expired yet, if any.
+        """
+        if not self.path or not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            now = time()
+            for key, (expiry, value) in entries.items():
+                if expiry > now:
+                    self._data[key] = (expiry, value)
+        except Exception as e:
+            logger.warning(
+                f'Cannot load cache {self.path}: {e}, {type(e)}'
+            )
+
+    async def save(self) -> None:
+        """
+        Persist the entries to `.path`, the entries are
+        serialized within the event loop and the file
+        is written in a thread. Failures are logged.
+        """
+        if not self.path:
+            return
+        data = json.dumps(dict(self._data))
+
+        def write() -> None:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(data)
+
+        try:
+            await asyncio.to_thread(write)
+        except OSError as e:
+            logger.warning(
+                f'Cannot save cache {self.path}: {e}, {type(e)}'
+            )
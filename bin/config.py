@@ -0,0 +1,114 @@
+import asyncio
+from collections.abc import Callable
+import json
+import logging
+import os
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+class JSONConfig:
+    """
+    Cached loader for a JSON configuration file,
+    the file is only parsed again when it changes.
+
+    Notes
+    -----
+    Use the `.load()` method to get the current snapshot,
+    the file is checked using its inode, modification
+    time and size. Checking and reading the file is done
+    in a thread, snapshots are created by the `parse`
+    callable, which also validates the data by raising
+    an exception when it is invalid.
+    """
+    def __init__(
+        self,
+        path: str,
+        default: dict[str, Any],
+        parse: Callable[[dict[str, Any]], Any]
+    ) -> None:
+        """
+        Parameters
+        ----------
+        path : str
+            Path of the JSON file.
+        default : dict[str, Any]
+            Data written when the file doesn't exist.
+        parse : Callable[[dict[str, Any]], Any]
+            Converts the loaded data into an
+            immutable snapshot, raises an
+            exception when the data is invalid.
+        """
+        self.path = path
+        self._default = default
+        self._parse = parse
+        # File status of the current snapshot
+        self._stat = None
+        # Start with the defaults until the file is loaded
+        self.snapshot = parse(default)
+
+    async def load(self) -> Any:
+        """
+        Get the snapshot, reloads the
+        file when it has changed.
+
+        Returns
+        -------
+        snapshot : Any
+            Snapshot of the current file.
+        """
+        # Create the file with the defaults when it doesn't exist
+        if (loaded := await asyncio.to_thread(self._read)) is None:
+            await self.write(self._default)
+            loaded = await asyncio.to_thread(self._read)
+
+        self._stat, self.snapshot = loaded
+        return self.snapshot
+
+    def _read(self) -> tuple[tuple[int, int, int], Any] | None:
+        """
+        Check the file and parse it when it changed,
+        runs in a thread to keep the file system
+        calls off of the event loop.
+
+        Returns
+        -------
+        (stat, snapshot) : tuple[tuple[int, int, int], Any] or None
+            File status and snapshot of the file,
+            None when the file doesn't exist.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        stat = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        # File changed, parse and validate it
+        snapshot = self.snapshot
+        if stat != self._stat:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    snapshot = self._parse(json.load(f))
+            except Exception as e:
+                logger.error(
+                    f'Invalid {self.path}, keeping the'
+                    f' previous configuration: {e}, {type(e)}'
+                )
+
+        return stat, snapshot
+
+    async def write(self, data: dict[str, Any]) -> None:
+        """
+        Write the data to the JSON file,
+        it is loaded again on the next use.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Data to write.
+        """
+        def write() -> None:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+
+        await asyncio.to_thread(write)
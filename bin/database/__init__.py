@@ -1,10 +1,12 @@
 from ._button_settings import ButtonSettings
 from ._enabled_guilds import EnabledGuilds
+from ._filter import Filter, GuildFilter
 from ._guilds import Guilds
 from ._ll2_agencies import LL2Agencies
 from ._ll2_agencies_filter import LL2AgenciesFilter
-from ._ll2_events import LL2Events
+from ._ll2_events import LL2Event, LL2Events
 from ._ll2_events_next import LL2EventsNext
+from ._migrations import Migrations
 from ._news_sites import News
 from ._news_sites_filter import NewsFilter
 from ._notification_countdown import NotificationCountdown
@@ -23,6 +25,7 @@ class Database(
     LL2AgenciesFilter,
     LL2Events,
     LL2EventsNext,
+    Migrations,
     News,
     NewsFilter,
     NotificationCountdown,
@@ -41,5 +44,8 @@ class Database(
         self._user = 'root'
         self._database = 'LiveLaunch'
         # Initialize filter classes
+        Filter.__init__(self)
         LL2AgenciesFilter.__init__(self)
         NewsFilter.__init__(self)
+        # Initialize sent media filters
+        SentMedia.__init__(self)
@@ -0,0 +1,72 @@
+from collections.abc import Iterable
+from hashlib import blake2b
+from math import ceil, log
+
+class BloomFilter:
+    """
+    Probabilistic set of strings, membership
+    checks can give false positives but
+    never give false negatives.
+    """
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float = 0.001,
+        items: Iterable[str] = ()
+    ) -> None:
+        """
+        Parameters
+        ----------
+        capacity : int
+            Amount of items before the
+            error rate starts increasing.
+        error_rate : float, default: 0.001
+            False positive rate at capacity.
+        items : Iterable[str], default: ()
+            Items to add.
+        """
+        capacity = max(capacity, 1)
+        # Optimal amount of bits and hashes
+        self._size = ceil(-capacity * log(error_rate) / log(2) ** 2)
+        self._hashes = max(round(self._size / capacity * log(2)), 1)
+        self._bits = bytearray(ceil(self._size / 8))
+        for item in items:
+            self.add(item)
+
+    def _indices(self, item: str) -> list[int]:
+        """
+        Get the bit indices of an item
+        using double hashing.
+
+        Parameters
+        ----------
+        item : str
+            Item to hash.
+
+        Returns
+        -------
+        indices : list[int]
+            Bit indices of the item.
+        """
+        digest = blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hashes)]
+
+    def add(self, item: str) -> None:
+        """
+        Add an item.
+
+        Parameters
+        ----------
+        item : str
+            Item to add.
+        """
+        for i in self._indices(item):
+            self._bits[i >> 3] |= 1 << (i & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[i >> 3] & (1 << (i & 7))
+            for i in self._indices(item)
+        )
@@ -90,6 +90,8 @@ class EnabledGuilds:
                 """,
                 (guild_id,)
             )
+        # Filters are removed with the guild
+        self.filter_cache_clear(guild_id=guild_id)
 
     async def enabled_guilds_check(self, guild_id: int) -> bool:
         """
@@ -362,6 +364,9 @@ class EnabledGuilds:
                     eg.notification_webhook_url IS NULL
                 """
             )
+            # Filters of removed guilds are gone
+            if cur.rowcount:
+                self.filter_cache_clear()
 
     async def enabled_guilds_unused_notification_iter(self) -> tuple[int, str]:
         """
@@ -1,4 +1,8 @@
 from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
+from os import getenv
+from time import monotonic
 
 @dataclass
 class FilterTable:
@@ -26,12 +30,64 @@ class FilterTable:
     name_column : str
         Column name of the data table
         that contains the names.
+    webhook_column : str
+        Column name of the `enabled_guilds`
+        table where the webhook URL of
+        the filtered feature is stored.
     """
     data_table: str
     filter_table: str
     id_column: str
     include_exclude_column: str
     name_column: str
+    webhook_column: str
+
+@dataclass(frozen=True)
+class GuildFilter:
+    """
+    Data class to store the filters
+    of a guild in memory.
+
+    Attributes
+    ----------
+    include_or_exclude : bool
+        `True` when included,
+        `False` when excluded.
+    ids : frozenset[int]
+        Filtered IDs.
+    names : frozenset[str]
+        Filtered names.
+    """
+    include_or_exclude: bool
+    ids: frozenset[int]
+    names: frozenset[str]
+
+    def check(
+        self,
+        *,
+        name_value: str | None = None,
+        id_value: int | None = None
+    ) -> bool:
+        """
+        Check if the name or ID is not
+        being filtered in the guild.
+
+        Parameters
+        ----------
+        name_value : str or None, default: None
+            Name to check.
+        id_value : int or None, default: None
+            ID to check.
+
+        Returns
+        -------
+        check : bool
+            True when the name or ID is
+            not filtered within the guild.
+        """
+        if name_value:
+            return name_value not in self.names
+        return id_value not in self.ids
 
 class Filter:
     """
@@ -39,6 +95,154 @@ class Filter:
     Contains methods for adding, removing,
     listing and checking filters.
     """
+    def __init__(self) -> None:
+        # Seconds before cached guild filters are reloaded,
+        # catches changes made outside of the bot, when 0
+        # the cache is disabled and bulk queries are used
+        self._filter_cache_ttl = int(getenv('FILTER_CACHE_TTL', 600))
+        # Filter table: (expiry, GuildFilter per guild ID)
+        self._filter_cache: dict[str, tuple[float, dict[int, GuildFilter]]] = {}
+
+    def filter_cache_clear(
+        self,
+        tables: FilterTable | None = None,
+        guild_id: int | None = None
+    ) -> None:
+        """
+        Invalidate cached guild filters.
+
+        Parameters
+        ----------
+        tables : FilterTable or None, default: None
+            FilterTable object
+            with the required
+            SQL table data, when
+            None, clear the cache
+            of every filter table.
+        guild_id : int or None, default: None
+            Discord guild ID, when None,
+            clear the cache of every guild.
+        """
+        # Single guilds are reloaded on their own
+        if guild_id:
+            for table, (_, guild_filters) in self._filter_cache.items():
+                if not tables or table == tables.filter_table:
+                    guild_filters.pop(guild_id, None)
+        elif tables:
+            self._filter_cache.pop(tables.filter_table, None)
+        else:
+            self._filter_cache.clear()
+
+    async def _filter_cache_load(
+        self,
+        tables: FilterTable,
+        guild_id: int | None = None
+    ) -> dict[int, GuildFilter]:
+        """
+        Load the filters of one or every
+        guild using a single query.
+
+        Parameters
+        ----------
+        tables : FilterTable
+            FilterTable object
+            with the required
+            SQL table data.
+        guild_id : int or None, default: None
+            Discord guild ID, when
+            None, load every guild.
+
+        Returns
+        -------
+        guild_filters : dict[int, GuildFilter]
+            Include/exclude setting and the
+            filtered names & IDs per guild ID.
+        """
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                f"""
+                SELECT
+                    eg.guild_id,
+                    eg.{tables.include_exclude_column},
+                    `data`.{tables.id_column},
+                    `data`.{tables.name_column}
+                FROM
+                    enabled_guilds AS eg
+                LEFT JOIN
+                    {tables.filter_table} AS `filter`
+                    ON `filter`.guild_id = eg.guild_id
+                LEFT JOIN
+                    {tables.data_table} AS `data`
+                    ON `data`.{tables.id_column} = `filter`.{tables.id_column}
+                {'WHERE eg.guild_id = %s' if guild_id else ''}
+                ORDER BY
+                    eg.guild_id
+                """,
+                (guild_id,) if guild_id else None
+            )
+            rows = await cur.fetchall()
+
+        guild_filters = {}
+        for guild, guild_rows in groupby(rows, key=itemgetter(0)):
+            guild_rows = list(guild_rows)
+            guild_filters[guild] = GuildFilter(
+                include_or_exclude=guild_rows[0][1] != 0,
+                ids=frozenset(row[2] for row in guild_rows if row[2] is not None),
+                names=frozenset(row[3] for row in guild_rows if row[3] is not None)
+            )
+        return guild_filters
+
+    async def filter_cache_get(
+        self,
+        tables: FilterTable,
+        guild_id: int
+    ) -> GuildFilter:
+        """
+        Get the filters of a guild from the cache, the
+        filters of every guild are loaded at once when
+        the cache of the filter table expired.
+
+        Parameters
+        ----------
+        tables : FilterTable
+            FilterTable object
+            with the required
+            SQL table data.
+        guild_id : int
+            Discord guild ID.
+
+        Returns
+        -------
+        guild_filter : GuildFilter
+            Include/exclude setting and
+            the filtered names & IDs.
+        """
+        now = monotonic()
+
+        # Reload every guild when not cached or expired
+        if not (
+            (cached := self._filter_cache.get(tables.filter_table))
+            and cached[0] > now
+        ):
+            cached = self._filter_cache[tables.filter_table] = (
+                now + self._filter_cache_ttl,
+                await self._filter_cache_load(tables)
+            )
+        guild_filters = cached[1]
+
+        # Reload a guild of which the filters changed
+        if guild_id not in guild_filters:
+            guild_filters |= await self._filter_cache_load(tables, guild_id)
+
+        return guild_filters.get(
+            guild_id,
+            GuildFilter(
+                include_or_exclude=False,
+                ids=frozenset(),
+                names=frozenset()
+            )
+        )
+
     async def filter_set_include_exclude(
         self,
         tables: FilterTable,
@@ -72,6 +276,7 @@ class Filter:
                 """,
                 (include_or_exclude, guild_id)
             )
+        self.filter_cache_clear(tables, guild_id)
 
     async def filter_get_include_exclude(
         self,
@@ -177,6 +382,9 @@ class Filter:
                     else:
                         failed.append(arg)
 
+        # Filters changed, reload them on next use
+        self.filter_cache_clear(tables, guild_id)
+
         return failed
 
     async def filter_add(
@@ -397,3 +605,137 @@ class Filter:
                     (guild_id, id_value)
                 )
             return (await cur.fetchone())[0] == 0
+
+    async def filter_eligible_iter(
+        self,
+        tables: FilterTable,
+        *,
+        names: list[str] | None = None,
+        ids: list[int | None] | None = None
+    ) -> tuple[int, str, list[bool]]:
+        """
+        Go over every guild with a webhook for
+        the filtered feature and yield which of
+        the given names or IDs it wants to receive.
+
+        Parameters
+        ----------
+        tables : FilterTable
+            FilterTable object
+            with the required
+            SQL table data.
+        names : list[str] or None, default: None
+            Names to check.
+        ids : list[int or None] or None, default: None
+            IDs to check, None is
+            treated as not filtered.
+
+        Yields
+        ------
+        tuple[
+            guild_id : int,
+            webhook_url : str,
+            eligible : list[bool]
+        ]
+            Yields the Discord guild ID, webhook
+            URL and per name or ID whether it should
+            be sent, guilds that want none are skipped.
+
+        Notes
+        -----
+        Uses the guild filter cache when enabled,
+        otherwise one query returns a bitmask
+        per guild, 64 names or IDs per column.
+        """
+        values = names if names is not None else ids
+        # Nothing to send, no guild is eligible
+        if not values:
+            return
+
+        # Filters from the cache
+        if self._filter_cache_ttl:
+            async with self.pool.acquire() as con, con.cursor() as cur:
+                await cur.execute(
+                    f"""
+                    SELECT guild_id, {tables.webhook_column}
+                    FROM enabled_guilds
+                    WHERE {tables.webhook_column} IS NOT NULL
+                    """
+                )
+                async for guild_id, webhook_url in cur:
+                    guild_filter = await self.filter_cache_get(tables, guild_id)
+                    eligible = [
+                        (
+                            guild_filter.check(name_value=value)
+                            if names is not None
+                            else guild_filter.check(id_value=value)
+                        ) if value else True
+                        for value in values
+                    ]
+                    # Set to include, invert filters
+                    if guild_filter.include_or_exclude:
+                        eligible = [not i for i in eligible]
+                    if any(eligible):
+                        yield guild_id, webhook_url, eligible
+            return
+
+        # Whether the guild filters the value
+        if names is not None:
+            filtered = f"""
+                EXISTS (
+                    SELECT 1
+                    FROM {tables.filter_table} AS `filter`
+                    JOIN {tables.data_table} AS `data`
+                        ON `data`.{tables.id_column} = `filter`.{tables.id_column}
+                    WHERE `filter`.guild_id = eg.guild_id
+                        AND `data`.{tables.name_column} = %s
+                )
+            """
+        else:
+            filtered = f"""
+                EXISTS (
+                    SELECT 1
+                    FROM {tables.filter_table} AS `filter`
+                    WHERE `filter`.guild_id = eg.guild_id
+                        AND `filter`.{tables.id_column} = %s
+                )
+            """
+        include = f'(eg.{tables.include_exclude_column} != 0)'
+
+        # Bitmask columns, eligible when filtered equals included
+        columns, args = [], []
+        for column, start in enumerate(range(0, len(values), 64)):
+            bits = []
+            for bit, value in enumerate(values[start:start + 64]):
+                if value:
+                    bits.append(f'((({filtered}) = {include}) << {bit})')
+                    args.append(value)
+                else:
+                    bits.append(f'((NOT {include}) << {bit})')
+            columns.append(f"({' | '.join(bits)}) AS eligible_{column}")
+
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                f"""
+                SELECT *
+                FROM (
+                    SELECT
+                        eg.guild_id,
+                        eg.{tables.webhook_column},
+                        {', '.join(columns)}
+                    FROM
+                        enabled_guilds AS eg
+                    WHERE
+                        eg.{tables.webhook_column} IS NOT NULL
+                ) AS guilds
+                WHERE
+                    {' OR '.join(f'eligible_{i} != 0' for i in range(len(columns)))}
+                """,
+                args
+            )
+            async for guild_id, webhook_url, *masks in cur:
+                eligible = [
+                    bool(masks[i // 64] >> (i % 64) & 1)
+                    for i in range(len(values))
+                ]
+                yield guild_id, webhook_url, eligible
@@ -10,7 +10,8 @@ class LL2AgenciesFilter(Filter):
             filter_table='ll2_agencies_filter',
             id_column='agency_id',
             include_exclude_column='agencies_include_exclude',
-            name_column='name'
+            name_column='name',
+            webhook_column='webhook_url'
         )
 
     async def ll2_agencies_filter_set_include_exclude(
@@ -187,3 +188,33 @@ class LL2AgenciesFilter(Filter):
             guild_id,
             id_value=agency_id
         )
+
+    async def ll2_agencies_filter_eligible_iter(
+        self,
+        agency_ids: list[int | None]
+    ) -> tuple[int, str, list[bool]]:
+        """
+        Go over every guild with a webhook
+        and yield which of the agencys it wants.
+
+        Parameters
+        ----------
+        agency_ids : list[int or None]
+            Agency IDs to check, None is not filtered.
+
+        Yields
+        ------
+        tuple[
+            guild_id : int,
+            webhook_url : str,
+            eligible : list[bool]
+        ]
+            Yields the Discord guild ID, webhook
+            URL and per agency whether it should
+            be sent, guilds that want none are skipped.
+        """
+        async for row in self.filter_eligible_iter(
+            self._agency_filter_table,
+            ids=agency_ids
+        ):
+            yield row
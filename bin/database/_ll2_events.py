@@ -1,59 +1,108 @@
 import aiomysql
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Any, ClassVar
 
 from ._missing import MISSING
 
+@dataclass(frozen=True, slots=True)
+class LL2Event:
+    """
+    Launch or event of Launch Library 2, parsed
+    from the API or stored in the database.
+
+    Notes
+    -----
+    `agency_name` and `location` aren't stored
+    in the database, stored events have None.
+    """
+    ll2_id: str
+    name: str
+    status: int | None
+    description: str | None
+    url: str | None
+    image_url: str | None
+    start: datetime
+    end: datetime
+    webcast_live: bool
+    slug: str
+    flightclub: bool
+    agency_id: int | None = None
+    agency_name: str | None = None
+    location: str | None = None
+
+    # Fields stored in the `ll2_events` table, compared by `.diff()`
+    data_keys: ClassVar[tuple[str, ...]] = (
+        'name',
+        'status',
+        'description',
+        'url',
+        'image_url',
+        'start',
+        'end',
+        'webcast_live',
+        'agency_id',
+        'flightclub'
+    )
+
+    def diff(self, new: 'LL2Event') -> dict[str, Any]:
+        """
+        Get the stored fields that changed.
+
+        Parameters
+        ----------
+        new : LL2Event
+            Newer data of the same event.
+
+        Returns
+        -------
+        changes : dict[str, Any]
+            New values of the changed fields.
+        """
+        return {
+            key: value
+            for key in self.data_keys
+            if (value := getattr(new, key)) != getattr(self, key)
+        }
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> 'LL2Event':
+        """
+        Create an event from a row of the `ll2_events` table.
+
+        Parameters
+        ----------
+        row : dict[str, Any]
+            Row of the `ll2_events` table.
+
+        Returns
+        -------
+        event : LL2Event
+            Stored event.
+        """
+        # Convert timezone unaware datetimes into UTC datetimes
+        row['start'] = row['start'].replace(tzinfo=timezone.utc)
+        row['end'] = row['end'].replace(tzinfo=timezone.utc)
+        # Convert booleans
+        row['webcast_live'] = bool(row['webcast_live'])
+        row['flightclub'] = bool(row['flightclub'])
+        return cls(**row)
+
+
 class LL2Events:
     """
     LL2 events table.
     """
-    async def ll2_events_add(
-        self,
-        ll2_id: str,
-        name: str,
-        description: str,
-        url: str,
-        image_url: str,
-        start: datetime,
-        end: datetime,
-        slug: str,
-        agency_id: int = None,
-        status: int = None,
-        webcast_live: bool = False,
-        flightclub: bool = False,
-        **kwargs
-    ) -> None:
+    async def ll2_events_add(self, event: LL2Event) -> None:
         """
         Adds an entry in the `ll2_events`
         table of the LiveLaunch database.
 
         Parameters
         ----------
-        ll2_id : str
-            Launch Library 2 ID.
-        name : str
-            Name of the event.
-        description : str
-            Event description.
-        url : str
-            Event live stream URL.
-        image_url : str
-            Event cover image URL.
-        start : datetime
-            Event start datetime object.
-        end : datetime
-            Event end datetime object.
-        slug : str
-            Slug of the event.
-        agency_id : int, default: None
-            LL2 agency ID.
-        status : int, default: None
-            Status ID.
-        webcast_live : bool, default: False
-            Event is live or not.
-        flightclub : bool, default: False
-            Event has a Flight Club page.
-        **kwargs
+        event : LL2Event
+            Event to add.
         """
         async with self.pool.acquire() as con, con.cursor() as cur:
             await cur.execute(
@@ -62,17 +111,18 @@ class LL2Events:
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """,
                 (
-                    ll2_id,
-                    agency_id,
-                    name,
-                    status,
-                    description, url,
-                    image_url,
-                    start,
-                    end,
-                    webcast_live,
-                    slug,
-                    flightclub
+                    event.ll2_id,
+                    event.agency_id,
+                    event.name,
+                    event.status,
+                    event.description,
+                    event.url,
+                    event.image_url,
+                    event.start,
+                    event.end,
+                    event.webcast_live,
+                    event.slug,
+                    event.flightclub
                 )
             )
 
@@ -101,7 +151,7 @@ class LL2Events:
     async def ll2_events_iter(
         self,
         asc_desc: str = 'asc'
-    ) -> dict[str, bool and datetime and str]:
+    ) -> AsyncIterator[LL2Event]:
         """
         Go over every row in the `ll2_events`
         table of the LiveLaunch database by
@@ -118,22 +168,8 @@ class LL2Events:
 
         Yields
         ------
-        dict[
-            ll2_id : str,
-            agency_id : int,
-            name : str,
-            status : int,
-            description : str,
-            url : str,
-            image_url : str,
-            start : datetime,
-            end : datetime,
-            webcast_live : bool,
-            slug : str,
-            flightclub : bool
-        ]
-            Yields row with of an LL2
-            event with the relevant data.
+        event : LL2Event
+            Stored LL2 event.
         """
         if asc_desc.lower() == 'asc':
             order = 'ASC'
@@ -154,18 +190,12 @@ class LL2Events:
                 """
             )
             async for row in cur:
-                # Convert timezone unaware datetimes into UTC datetimes
-                row['start'] = row['start'].replace(tzinfo=timezone.utc)
-                row['end'] = row['end'].replace(tzinfo=timezone.utc)
-                # Convert booleans
-                row['webcast_live'] = bool(row['webcast_live'])
-                row['flightclub'] = bool(row['flightclub'])
-                yield row
+                yield LL2Event.from_row(row)
 
     async def ll2_events_get(
         self,
         ll2_id: str
-    ) -> dict[str, datetime and str] or None:
+    ) -> LL2Event or None:
         """
         Retrieves an entry from the `ll2_events`
         table of the LiveLaunch database.
@@ -177,20 +207,8 @@ class LL2Events:
 
         Returns
         -------
-        dict[
-            agency_id : int,
-            name : str,
-            status : int,
-            description : str,
-            url : str,
-            image_url : str,
-            start : datetime,
-            end : datetime,
-            webcast_live : bool,
-            slug : str,
-            flightclub : bool
-        ] or None
-            Returns a row with the ll2_event's data
+        event : LL2Event or None
+            Returns the stored LL2 event
             if it exists, otherwise None.
         """
         async with (
@@ -207,13 +225,7 @@ class LL2Events:
             )
             row = await cur.fetchone()
         if row:
-            # Convert timezone unaware datetimes into UTC datetimes
-            row['start'] = row['start'].replace(tzinfo=timezone.utc)
-            row['end'] = row['end'].replace(tzinfo=timezone.utc)
-            # Convert booleans
-            row['webcast_live'] = bool(row['webcast_live'])
-            row['flightclub'] = bool(row['flightclub'])
-        return row
+            return LL2Event.from_row(row)
 
     async def ll2_events_edit(
         self,
@@ -10,7 +10,8 @@ class NewsFilter(Filter):
             filter_table='news_filter',
             id_column='news_site_id',
             include_exclude_column='news_include_exclude',
-            name_column='news_site_name'
+            name_column='news_site_name',
+            webhook_column='news_webhook_url'
         )
 
     async def news_filter_set_include_exclude(
@@ -187,3 +188,33 @@ class NewsFilter(Filter):
             guild_id,
             name_value=news_site_name
         )
+
+    async def news_filter_eligible_iter(
+        self,
+        news_site_names: list[str]
+    ) -> tuple[int, str, list[bool]]:
+        """
+        Go over every guild with a news webhook
+        and yield which of the news sites it wants.
+
+        Parameters
+        ----------
+        news_site_names : list[str]
+            News site names to check.
+
+        Yields
+        ------
+        tuple[
+            guild_id : int,
+            webhook_url : str,
+            eligible : list[bool]
+        ]
+            Yields the Discord guild ID, webhook
+            URL and per news site whether it should
+            be sent, guilds that want none are skipped.
+        """
+        async for row in self.filter_eligible_iter(
+            self._news_filter_table,
+            names=news_site_names
+        ):
+            yield row
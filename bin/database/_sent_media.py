@@ -1,9 +1,270 @@
+from collections import OrderedDict
 from datetime import datetime, timezone
+import logging
+
+from ._bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
 
 class SentMedia:
     """
     Sent streams/news tables.
+
+    Notes
+    -----
+    Checks go through a Bloom filter and a small
+    LRU of recently seen IDs per table, only IDs
+    that might have been sent but aren't known
+    exactly are checked in the database. The
+    filters are loaded by `.sent_media_warm()`,
+    before that every check uses the database.
+
+    The streams table is partitioned by month, old
+    entries are removed by dropping partitions.
+    Every unique key of a partitioned table has
+    to include the partitioning column, so its
+    primary key is (ID, datetime) and IDs are
+    kept unique by checking them before adding.
+    The news table isn't partitioned, its
+    primary key keeps the article IDs unique.
     """
+    # Partitioned table: (ID column, column definitions)
+    _sent_media_tables = {
+        'streams': (
+            'yt_vid_id',
+            """
+            yt_vid_id CHAR(11) CHARACTER SET ascii COLLATE ascii_bin NOT NULL,
+            datetime DATETIME NOT NULL,
+            PRIMARY KEY (yt_vid_id, datetime)
+            """
+        )
+    }
+
+    def __init__(self) -> None:
+        # Maximum amount of recently seen IDs per table
+        self._sent_media_recent_size = 1024
+        # Table: Bloom filter of the sent IDs, None until warmed
+        self._sent_media_bloom: dict[str, BloomFilter | None] = {
+            'news': None,
+            'streams': None
+        }
+        # Table: recently seen IDs
+        self._sent_media_recent: dict[str, OrderedDict[str, None]] = {
+            'news': OrderedDict(),
+            'streams': OrderedDict()
+        }
+
+    @staticmethod
+    def _sent_media_table(
+        snapi_ids: list[int] | None,
+        yt_vid_ids: list[str] | None
+    ) -> tuple[str, str, list[int] | list[str]]:
+        """
+        Select the sent media table of the given IDs.
+
+        Parameters
+        ----------
+        snapi_ids : list[int] or None
+            SNAPI article IDs.
+        yt_vid_ids : list[str] or None
+            YouTube video IDs.
+
+        Returns
+        -------
+        (table, col, ids) : tuple[str, str, list[int] | list[str]]
+            Table name, ID column name and
+            the IDs without duplicates.
+        """
+        if snapi_ids:
+            return 'news', 'snapi_id', list(dict.fromkeys(snapi_ids))
+        return 'streams', 'yt_vid_id', list(dict.fromkeys(yt_vid_ids or ()))
+
+    def _sent_media_seen(self, table: str, ids: list[int] | list[str]) -> None:
+        """
+        Remember IDs as sent in the in-process filters.
+
+        Parameters
+        ----------
+        table : str
+            Sent media table, `news` or `streams`.
+        ids : list[int] or list[str]
+            Sent IDs.
+        """
+        bloom = self._sent_media_bloom[table]
+        recent = self._sent_media_recent[table]
+        for id in map(str, ids):
+            if bloom is not None:
+                bloom.add(id)
+            recent[id] = None
+            recent.move_to_end(id)
+        # Remove least recently seen IDs
+        while len(recent) > self._sent_media_recent_size:
+            recent.popitem(last=False)
+
+    async def sent_media_upgrade(self) -> None:
+        """
+        Creates the partitioned sent media tables,
+        existing unpartitioned tables are copied
+        into the new schema and replaced.
+        """
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            for table, (col, columns) in self._sent_media_tables.items():
+                # Already partitioned
+                await cur.execute(
+                    """
+                    SELECT COUNT(*)
+                    FROM information_schema.PARTITIONS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                        AND TABLE_NAME = %s
+                        AND PARTITION_NAME IS NOT NULL
+                    """,
+                    (f'sent_{table}',)
+                )
+                if (await cur.fetchone())[0]:
+                    continue
+
+                # New table with a single partition, months are
+                # split off by `.sent_media_partition()`
+                await cur.execute(f'DROP TABLE IF EXISTS sent_{table}_new')
+                await cur.execute(
+                    f"""
+                    CREATE TABLE sent_{table}_new (
+                    {columns}
+                    )
+                    PARTITION BY RANGE COLUMNS(datetime) (
+                        PARTITION pmax VALUES LESS THAN (MAXVALUE)
+                    )
+                    """
+                )
+
+                # Copy the entries of an existing table, once per ID
+                await cur.execute(
+                    """
+                    SELECT COUNT(*)
+                    FROM information_schema.TABLES
+                    WHERE TABLE_SCHEMA = DATABASE()
+                        AND TABLE_NAME = %s
+                    """,
+                    (f'sent_{table}',)
+                )
+                if not (await cur.fetchone())[0]:
+                    await cur.execute(f'RENAME TABLE sent_{table}_new TO sent_{table}')
+                    continue
+                await cur.execute(
+                    f"""
+                    INSERT INTO sent_{table}_new
+                    SELECT {col}, MIN(COALESCE(datetime, UTC_TIMESTAMP()))
+                    FROM sent_{table}
+                    WHERE {col} IS NOT NULL
+                        AND CHAR_LENGTH({col}) <= 11
+                    GROUP BY {col}
+                    """
+                )
+                await cur.execute(
+                    f"""
+                    RENAME TABLE
+                        sent_{table} TO sent_{table}_old,
+                        sent_{table}_new TO sent_{table}
+                    """
+                )
+                await cur.execute(f'DROP TABLE sent_{table}_old')
+                logger.info(f'Upgraded sent_{table} to the partitioned schema')
+
+    async def sent_media_partition(self, months_ahead: int = 2) -> None:
+        """
+        Adds monthly partitions to the partitioned sent
+        media tables and drops the ones older than a year.
+
+        Parameters
+        ----------
+        months_ahead : int, default: 2
+            Amount of future months
+            to have a partition for.
+
+        Notes
+        -----
+        A month is dropped once all of its entries
+        are older than a year, entries are therefore
+        kept for twelve to thirteen months.
+        """
+        now = datetime.now(timezone.utc)
+        # Months are numbered as year * 12 + month - 1
+        current = now.year * 12 + now.month - 1
+
+        def name(month: int) -> str:
+            return f'p{month // 12:04}{month % 12 + 1:02}'
+
+        def bound(month: int) -> str:
+            # First day of the next month
+            return f'{(month + 1) // 12:04}-{(month + 1) % 12 + 1:02}-01'
+
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            for table in self._sent_media_tables:
+                # Months with a partition, named pYYYYMM
+                await cur.execute(
+                    """
+                    SELECT PARTITION_NAME
+                    FROM information_schema.PARTITIONS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                        AND TABLE_NAME = %s
+                        AND PARTITION_NAME != 'pmax'
+                    """,
+                    (f'sent_{table}',)
+                )
+                months = sorted(
+                    int(row[0][1:5]) * 12 + int(row[0][5:]) - 1
+                    for row in await cur.fetchall()
+                )
+
+                # Continue after the last month, or start at the oldest entry
+                if months:
+                    start = months[-1] + 1
+                else:
+                    await cur.execute(f'SELECT MIN(datetime) FROM sent_{table}')
+                    oldest = (await cur.fetchone())[0] or now
+                    start = min(oldest.year * 12 + oldest.month - 1, current)
+
+                # Split the new months off the last partition
+                if added := list(range(start, current + months_ahead + 1)):
+                    partitions = ', '.join(
+                        f"PARTITION {name(m)} VALUES LESS THAN ('{bound(m)}')"
+                        for m in added
+                    )
+                    await cur.execute(
+                        f"""
+                        ALTER TABLE sent_{table}
+                        REORGANIZE PARTITION pmax INTO (
+                            {partitions},
+                            PARTITION pmax VALUES LESS THAN (MAXVALUE)
+                        )
+                        """
+                    )
+                    months += added
+
+                # Drop the months older than a year
+                if dropped := [m for m in months if m < current - 12]:
+                    await cur.execute(
+                        f"""
+                        ALTER TABLE sent_{table}
+                        DROP PARTITION {', '.join(map(name, dropped))}
+                        """
+                    )
+
+    async def sent_media_warm(self) -> None:
+        """
+        Load the IDs of the sent media tables
+        into new in-process Bloom filters.
+        """
+        async with self.pool.acquire() as con, con.cursor() as cur:
+            for table, col in (('news', 'snapi_id'), ('streams', 'yt_vid_id')):
+                await cur.execute(f'SELECT {col} FROM sent_{table}')
+                ids = [str(row[0]) for row in await cur.fetchall()]
+                # Leave room for the IDs sent until the next warm up
+                self._sent_media_bloom[table] = BloomFilter(
+                    max(2 * len(ids), 16384),
+                    items=ids
+                )
+
     async def sent_media_add(
         self,
         *,
@@ -25,27 +286,53 @@ class SentMedia:
             Datetime object, when default,
             the current UTC datetime is used.
         """
+        await self.sent_media_add_many(
+            snapi_ids=[snapi_id] if snapi_id else None,
+            yt_vid_ids=[yt_vid_id],
+            timestamp=timestamp
+        )
+
+    async def sent_media_add_many(
+        self,
+        *,
+        snapi_ids: list[int] = None,
+        yt_vid_ids: list[str] = None,
+        timestamp: datetime = None
+    ) -> None:
+        """
+        Adds entries in the specified sent media
+        table of the LiveLaunch database using
+        a single multi-row insert.
+
+        Parameters
+        ----------
+        snapi_ids : list[int], default: None
+            SNAPI article IDs.
+        yt_vid_ids : list[str], default: None
+            YouTube video IDs.
+        timestamp : datetime, default: None
+            Datetime object, when default,
+            the current UTC datetime is used.
+        """
+        table, _, ids = self._sent_media_table(snapi_ids, yt_vid_ids)
+        if not ids:
+            return
+
         if timestamp is None:
             timestamp = datetime.now(timezone.utc)
 
-        # Select the correct sent media table
-        if snapi_id:
-            table = 'news'
-            args = (snapi_id, timestamp)
-        else:
-            table = 'streams'
-            args = (yt_vid_id, timestamp)
-
         # Connect and add
         async with self.pool.acquire() as con, con.cursor() as cur:
-            await cur.execute(
+            await cur.executemany(
                 f"""
                 INSERT INTO sent_{table}
                 VALUES (%s, %s)
                 """,
-                args
+                [(id, timestamp) for id in ids]
             )
 
+        self._sent_media_seen(table, ids)
+
     async def sent_media_clean(self) -> None:
         """
         Removes old entries in the sent media
@@ -53,18 +340,23 @@ class SentMedia:
 
         Notes
         -----
-        Removes entries older than one year.
+        Drops the monthly partitions older than
+        one year, see `.sent_media_partition()`,
+        and deletes news older than one year.
         """
+        await self.sent_media_partition()
+
         async with self.pool.acquire() as con, con.cursor() as cur:
             await cur.execute(
                 """
                 DELETE FROM sent_news
-                WHERE datetime < DATE_SUB(NOW(), INTERVAL 1 YEAR);
-                DELETE FROM sent_streams
-                WHERE datetime < DATE_SUB(NOW(), INTERVAL 1 YEAR)
+                WHERE datetime < DATE_SUB(UTC_TIMESTAMP(), INTERVAL 1 YEAR)
                 """
             )
 
+        # Rebuild the filters without the removed IDs
+        await self.sent_media_warm()
+
     async def sent_media_exists(
         self,
         *,
@@ -88,24 +380,61 @@ class SentMedia:
             Returns a boolean whether an entry
             exists with the given ID.
         """
-        # Select the correct sent media table
-        if snapi_id:
-            table = 'news'
-            col = 'snapi_id'
-            args = (snapi_id,)
-        else:
-            table = 'streams'
-            col = 'yt_vid_id'
-            args = (yt_vid_id,)
-
-        # Connect and check
-        async with self.pool.acquire() as con, con.cursor() as cur:
-            await cur.execute(
-                f"""
-                SELECT COUNT(*)
-                FROM sent_{table}
-                WHERE {col}=%s
-                """,
-                args
-            )
-            return (await cur.fetchone())[0] != 0
+        return not await self.sent_media_unseen(
+            snapi_ids=[snapi_id] if snapi_id else None,
+            yt_vid_ids=[yt_vid_id]
+        )
+
+    async def sent_media_unseen(
+        self,
+        *,
+        snapi_ids: list[int] = None,
+        yt_vid_ids: list[str] = None
+    ) -> list[int] | list[str]:
+        """
+        Get the IDs without an entry in the specified
+        sent media table of the LiveLaunch database
+        using at most a single query.
+
+        Parameters
+        ----------
+        snapi_ids : list[int], default: None
+            SNAPI article IDs.
+        yt_vid_ids : list[str], default: None
+            YouTube video IDs.
+
+        Returns
+        -------
+        unseen : list[int] or list[str]
+            IDs that haven't been sent yet,
+            in the order they were given.
+        """
+        table, col, ids = self._sent_media_table(snapi_ids, yt_vid_ids)
+
+        # Only check the IDs that might have been sent in the database
+        bloom = self._sent_media_bloom[table]
+        recent = self._sent_media_recent[table]
+        seen, check = set(), []
+        for id in ids:
+            if (key := str(id)) in recent:
+                recent.move_to_end(key)
+                seen.add(key)
+            elif bloom is None or key in bloom:
+                check.append(id)
+
+        if check:
+            # Connect and check
+            async with self.pool.acquire() as con, con.cursor() as cur:
+                await cur.execute(
+                    f"""
+                    SELECT {col}
+                    FROM sent_{table}
+                    WHERE {col} IN ({', '.join(['%s'] * len(check))})
+                    """,
+                    check
+                )
+                found = [row[0] for row in await cur.fetchall()]
+            self._sent_media_seen(table, found)
+            seen.update(map(str, found))
+
+        return [id for id in ids if str(id) not in seen]
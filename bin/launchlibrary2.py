@@ -1,9 +1,13 @@
 import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from typing import Any
 from datetime import datetime, timedelta, timezone
 from isodate import parse_duration
 import os
+from time import monotonic
 
-from bin import get
+from bin import get, LL2Event, NOT_MODIFIED, shared_session
 
 class LaunchLibrary2:
     """
@@ -77,19 +81,6 @@ class LaunchLibrary2:
     def __init__(self) -> None:
         # Authentication header
         self.__ll2_auth_header = {'Authorization': f"Token {os.getenv('LL2_TOKEN')}"}
-        # Keys in the returned data containing non ID data.
-        self.data_keys = (
-            'name',
-            'status',
-            'description',
-            'url',
-            'image_url',
-            'start',
-            'end',
-            'webcast_live',
-            'agency_id',
-            'flightclub'
-        )
         # Max amount of events
         self.max_events = 64
         # Max description length
@@ -106,210 +97,435 @@ class LaunchLibrary2:
         # Supported image formats
         self.image_formats = ('.gif', '.jpeg', '.jpg', '.png', '.webp')
         # Launch Library 2 API
-        self.ll2_launch_url = 'https://ll.thespacedevs.com/2.3.0/launches/upcoming/?limit=50&mode=detailed&net__lte=%s'
-        self.ll2_event_url = 'https://ll.thespacedevs.com/2.3.0/events/upcoming/?date__lte=%s&limit=50'
-
-    async def ll2_request(self, url: str) -> dict or None:
+        self.ll2_launch_url = 'https://ll.thespacedevs.com/2.3.0/launches/upcoming/?limit=50&mode=detailed&net__lte=%s&ordering=net'
+        self.ll2_event_url = 'https://ll.thespacedevs.com/2.3.0/events/upcoming/?date__lte=%s&limit=50&ordering=date'
+        # Maximum NET per day, keeps URLs stable for conditional requests
+        self.ll2_max_net_format = '%Y-%m-%dT00:00:00Z'
+        # Only changes since the last poll are requested, with a
+        # periodic full resync to catch removed launches and events
+        self.ll2_resync_interval = timedelta(minutes=30)
+        # Overlap of the polls, covers clock differences
+        self.ll2_poll_overlap = timedelta(minutes=1)
+        self.ll2_last_updated_format = '&last_updated__gte=%Y-%m-%dT%H:%M:%SZ'
+        # Kind: snapshot of the parsed entries per LL2 ID
+        self._snapshots = {'launches': {}, 'events': {}}
+        # Kind: start time of the last successful poll and full sync
+        self._polled: dict[str, datetime | None] = {'launches': None, 'events': None}
+        self._synced: dict[str, datetime | None] = {'launches': None, 'events': None}
+        # Last parsed responses of conditional requests, reused when not modified
+        self._ll2_responses: dict[str, dict] = {}
+        self._ll2_responses_size = 16
+        # Seconds between polls, fast near T-0 or during live webcasts,
+        # default when anything starts within a day, idle otherwise
+        self.poll_intervals = {'fast': 30, 'default': 180, 'idle': 600}
+        self.poll_fast_window = timedelta(hours=1)
+        self.poll_default_window = timedelta(days=1)
+        # Maximum amount of LL2 requests per hour
+        self.ll2_hourly_budget = int(os.getenv('LL2_HOURLY_BUDGET', 200))
+        # Monotonic times of the requests within the last hour
+        self._ll2_requests: deque[float] = deque()
+        # Total amount of requests and the amount used by the last poll
+        self._ll2_request_count = 0
+        self._ll2_poll_requests = 2
+
+    async def ll2_request(
+        self,
+        url: str,
+        conditional: bool = True,
+        parse: Callable[[dict], Any] | None = None
+    ) -> dict or None:
         """
-        Requests the Launch Library 2 API for the results of `url`.
+        Requests the Launch Library 2 API for a page of `url`.
 
         Parameters
         ----------
         url : str
             URL for the Launch Library 2 request.
+        conditional : bool, default: True
+            Whether to use a conditional request,
+            only useful for recurring URLs.
+        parse : Callable[[dict], Any] or None, default: None
+            Parses every result of the page,
+            when None the results are kept as is.
 
         Returns
         -------
-        results : dict or None
-            Get a dictionary of the results or None if it fails.
+        page : dict or None
+            Get a dictionary of the page with its `count`,
+            `next` and (parsed) `results`, or None if it fails.
+
+        Notes
+        -----
+        When a conditional request is not modified, the
+        previous parsed response of the URL is returned
+        without parsing it again.
         """
+        # Count the request towards the hourly budget
+        self._ll2_requests.append(monotonic())
+        self._ll2_request_count += 1
+
         # Request data from the LL2 API
         try:
             result = await get(
                 url,
                 headers=self.__ll2_auth_header,
-                json=True
+                json=True,
+                conditional=conditional
             )
         except:
             return
         else:
+            if result is NOT_MODIFIED:
+                if url in self._ll2_responses:
+                    return self._ll2_responses[url]
+                # Response isn't kept anymore, request it in full
+                shared_session.validators.pop(url, None)
+                return await self.ll2_request(url, conditional, parse)
             if 'results' in result:
-                return result['results']
+                if parse is not None:
+                    result['results'] = list(map(parse, result['results']))
+                if conditional:
+                    # Only keep the most recent responses
+                    self._ll2_responses.pop(url, None)
+                    self._ll2_responses[url] = result
+                    while len(self._ll2_responses) > self._ll2_responses_size:
+                        del self._ll2_responses[next(iter(self._ll2_responses))]
+                return result
+
+    async def ll2_pages(
+        self,
+        url: str,
+        conditional: bool = True,
+        max_results: int | None = None,
+        parse: Callable[[dict], Any] | None = None
+    ) -> AsyncIterator[list]:
+        """
+        Requests the pages of `url`, the first page
+        is requested first to get the amount of
+        results, the other pages are requested
+        concurrently afterwards.
 
-    async def upcoming_launches(self) -> dict[str, dict[str, bool and datetime and int and str]]:
+        Parameters
+        ----------
+        url : str
+            URL for the Launch Library 2 request.
+        conditional : bool, default: True
+            Whether to use conditional requests.
+        max_results : int or None, default: None
+            Stop after the page containing
+            this result, None for all pages.
+        parse : Callable[[dict], Any] or None, default: None
+            Parses every result, see `.ll2_request()`.
+
+        Yields
+        ------
+        results : list
+            (Parsed) results of a page, in
+            the order the pages are received.
+
+        Raises
+        ------
+        ConnectionError
+            When a page can't be requested.
+        """
+        if (page := await self.ll2_request(url, conditional, parse)) is None:
+            raise ConnectionError(f'Cannot request {url}')
+        yield page['results']
+
+        # Offsets of the remaining pages
+        count = page['count']
+        if max_results is not None:
+            count = min(count, max_results)
+        if not (limit := len(page['results'])):
+            return
+        requests = [
+            asyncio.create_task(
+                self.ll2_request(f'{url}&offset={offset}', conditional, parse)
+            )
+            for offset in range(limit, count, limit)
+        ]
+
+        try:
+            for request in asyncio.as_completed(requests):
+                if (page := await request) is None:
+                    raise ConnectionError(f'Cannot request {url}')
+                yield page['results']
+        finally:
+            # Stopped early, cancel the remaining requests
+            for request in requests:
+                request.cancel()
+
+    async def _ingest(
+        self,
+        kind: str,
+        url: str,
+        parse: Callable[[dict], tuple[str, LL2Event]]
+    ) -> dict[str, LL2Event]:
+        """
+        Update the snapshot of launches or events with the
+        entries changed since the last successful poll,
+        pages are parsed as they arrive, unchanged pages
+        reuse their previous parsed entries.
+
+        Parameters
+        ----------
+        kind : str
+            Snapshot to update, `launches` or `events`.
+        url : str
+            URL requesting all upcoming entries.
+        parse : Callable[[dict], tuple[str, LL2Event]]
+            Parses an entry into its LL2 ID and data.
+
+        Returns
+        -------
+        snapshot : dict[str, LL2Event]
+            Parsed entries per LL2 ID, the previous
+            snapshot is kept when the request fails.
+
+        Notes
+        -----
+        Every `.ll2_resync_interval` the full list is requested
+        to replace the snapshot, catching removed entries.
+        Entries are ordered by their start, so only the
+        first `.max_events` entries can be used and
+        the full list stops after those.
+        """
+        now = datetime.now(timezone.utc)
+        polled, synced = self._polled[kind], self._synced[kind]
+        full = polled is None or now - synced >= self.ll2_resync_interval
+
+        # Only request the entries changed since the last poll
+        if not full:
+            url += (polled - self.ll2_poll_overlap).strftime(
+                self.ll2_last_updated_format
+            )
+        entries = {}
+        try:
+            async for results in self.ll2_pages(
+                url,
+                conditional=full,
+                max_results=self.max_events if full else None,
+                parse=parse
+            ):
+                entries |= results
+        # Failed, retry from the same poll next time
+        except ConnectionError:
+            return self._snapshots[kind]
+
+        if not full:
+            entries = self._snapshots[kind] | entries
+        # Keep the first `.max_events` entries
+        self._snapshots[kind] = dict(
+            sorted(entries.items(), key=lambda item: item[1].start)[:self.max_events]
+        )
+
+        self._polled[kind] = now
+        if full:
+            self._synced[kind] = now
+        return self._snapshots[kind]
+
+    async def upcoming_launches(self) -> dict[str, LL2Event]:
         """
         Gets data of upcoming launches.
 
         Returns
         -------
-        streams : dict[str, dict[str, bool and datetime and str]]
-            Dictionairy with the launch name, webcast_live,
-            mission description, net time, video URL and LL2 ID.
+        streams : dict[str, LL2Event]
+            Upcoming launches per LL2 ID.
+
+        Notes
+        -----
+        Only the launches changed since the
+        last poll are requested, see `._ingest()`.
         """
-        # Request data
         max_net = datetime.now(timezone.utc) + self.timedelta_max_net
-        results = await self.ll2_request(
-            self.ll2_launch_url % max_net.strftime('%Y-%m-%dT%H:%M:%SZ')
+        return await self._ingest(
+            'launches',
+            self.ll2_launch_url % max_net.strftime(self.ll2_max_net_format),
+            self._parse_launch
         )
-        if results is None:
-            return {}
 
-        # Storage dict for returning
-        launches = {}
-
-        # Go through data
-        for entry in results:
-            # Start datetime of the entry
-            net = datetime.fromisoformat(entry['net'])
-
-            # Name formatting
-            if (net_precision := entry['net_precision']) is not None:
-                # Name with NET precision
-                name = net.strftime(
-                    self.net_precision_formats.get(net_precision['id'], '')
-                ) + entry['name']
-            else:
-                # Name with potential [TBD] (To Be Determined) prefix
-                name = entry['name'] if entry['status']['id'] != 2 else '[TBD] ' + entry['name']
-
-            # Check for videos
-            priority = None
-            picked_video = None
-            for url in entry['vid_urls']:
-                # Find lowest priority value
-                if priority is None or url['priority'] < priority:
-                    priority = url['priority']
-                    picked_video = url['url']
-
-            # Check description length and trim if needed
-            if (description := entry['mission']) is not None:
-                # Grab description
-                description = description['description']
-                # Check length
-                if len(description) > self.max_description_length:
-                    description = description[:self.max_description_length-3] + '...'
-
-            # Image format check
-            if ((image := entry['image']) is None or
-                    (image_url := image['image_url']) and
-                    not image_url.lower().endswith(self.image_formats)):
-                image_url = None
-
-            # Adding event to launches list
-            launches[entry['id']] = {
-                'name': name,
-                'description': description,
-                'url': picked_video,
-                'image_url': image_url,
-                'start': net,
-                'end': net + self.event_duration['default'],
-                'location': entry['pad']['location']['name'],
-                'webcast_live': entry['webcast_live'],
-                'slug': entry['slug'],
-                'agency_id': entry['launch_service_provider']['id'],
-                'agency_name': entry['launch_service_provider']['name'],
-                'status': entry['status']['id'],
-                'flightclub': bool(entry['flightclub_url'])
-            }
+    def _parse_launch(self, entry: dict) -> tuple[str, LL2Event]:
+        """
+        Parses a launch of the LL2 API.
 
-        # Returning
-        return launches
+        Parameters
+        ----------
+        entry : dict
+            Launch of the LL2 API.
+
+        Returns
+        -------
+        (ll2_id, launch) : tuple[str, LL2Event]
+            LL2 ID and the launch.
+        """
+        # Start datetime of the entry
+        net = datetime.fromisoformat(entry['net'])
+
+        # Name formatting
+        if (net_precision := entry['net_precision']) is not None:
+            # Name with NET precision
+            name = net.strftime(
+                self.net_precision_formats.get(net_precision['id'], '')
+            ) + entry['name']
+        else:
+            # Name with potential [TBD] (To Be Determined) prefix
+            name = entry['name'] if entry['status']['id'] != 2 else '[TBD] ' + entry['name']
+
+        # Check for videos
+        priority = None
+        picked_video = None
+        for url in entry['vid_urls']:
+            # Find lowest priority value
+            if priority is None or url['priority'] < priority:
+                priority = url['priority']
+                picked_video = url['url']
+
+        # Check description length and trim if needed
+        if (description := entry['mission']) is not None:
+            # Grab description
+            description = description['description']
+            # Check length
+            if len(description) > self.max_description_length:
+                description = description[:self.max_description_length-3] + '...'
+
+        # Image format check
+        if ((image := entry['image']) is None or
+                (image_url := image['image_url']) and
+                not image_url.lower().endswith(self.image_formats)):
+            image_url = None
+
+        return entry['id'], LL2Event(
+            ll2_id=entry['id'],
+            name=name,
+            status=entry['status']['id'],
+            description=description,
+            url=picked_video,
+            image_url=image_url,
+            start=net,
+            end=net + self.event_duration['default'],
+            webcast_live=entry['webcast_live'],
+            slug=entry['slug'],
+            flightclub=bool(entry['flightclub_url']),
+            agency_id=entry['launch_service_provider']['id'],
+            agency_name=entry['launch_service_provider']['name'],
+            location=entry['pad']['location']['name']
+        )
 
-    async def upcoming_events(self) -> dict[str, dict[str, bool and datetime and str]]:
+    async def upcoming_events(self) -> dict[str, LL2Event]:
         """
         Gets data of upcoming events.
 
         Returns
         -------
-        streams : dict[str, dict[str, bool and datetime and str]]
-            Dictionairy with the event name, webcast_live,
-            mission description, net time, video URL and LL2 ID.
+        streams : dict[str, LL2Event]
+            Upcoming events per LL2 ID.
+
+        Notes
+        -----
+        Only the events changed since the
+        last poll are requested, see `._ingest()`.
         """
-        # Request data
         max_net = datetime.now(timezone.utc) + self.timedelta_max_net
-        results = await self.ll2_request(
-            self.ll2_event_url % max_net.strftime('%Y-%m-%dT%H:%M:%SZ')
+        return await self._ingest(
+            'events',
+            self.ll2_event_url % max_net.strftime(self.ll2_max_net_format),
+            self._parse_event
         )
-        if results is None:
-            return {}
 
-        # Storage dict for returning
-        events = {}
-
-        # Go through data
-        for entry in results:
-            # Start datetime of the entry
-            net = datetime.fromisoformat(entry['date'])
-
-            # Name formatting
-            if (net_precision := entry['date_precision']) is not None:
-                # Name with NET precision
-                name = net.strftime(
-                    self.net_precision_formats.get(net_precision['id'], '')
-                ) + entry['name']
-            else:
-                name = '[TBD] ' + entry['name']
-
-            # Default duration if event type is not known
-            event_type = entry['type']['name']
-            if not event_type in self.event_duration:
-                event_type = 'default'
-
-            # Duration timedelta using potential duration
-            if (duration := entry['duration']) is not None:
-                duration = parse_duration(duration)
-            else:
-                duration = self.event_duration[event_type]
-
-            # Check for videos
-            priority = None
-            picked_video = None
-            for url in entry['vid_urls']:
-                # Find lowest priority value
-                if priority is None or url['priority'] < priority:
-                    priority = url['priority']
-                    picked_video = url['url']
-
-            # Check description length and trim if needed
-            if ((description := entry['description']) is not None
-                    and len(description) > self.max_description_length):
-                description = description[:self.max_description_length-3] + '...'
+    def _parse_event(self, entry: dict) -> tuple[str, LL2Event]:
+        """
+        Parses an event of the LL2 API.
 
-            # Image format check
-            if ((image := entry['image']) is None or
-                    (image_url := image['image_url']) and
-                    not image_url.lower().endswith(self.image_formats)):
-                image_url = None
-
-            # Adding event to events list
-            events[str(entry['id'])] = {
-                'name': name,
-                'description': description,
-                'url': picked_video,
-                'image_url': image_url,
-                'start': net,
-                'end': net + duration,
-                'location': entry['location'],
-                'webcast_live': entry['webcast_live'],
-                'slug': entry['slug'],
-                'flightclub': False
-            }
+        Parameters
+        ----------
+        entry : dict
+            Event of the LL2 API.
 
-        # Returning
-        return events
+        Returns
+        -------
+        (ll2_id, event) : tuple[str, LL2Event]
+            LL2 ID and the event.
+        """
+        # Start datetime of the entry
+        net = datetime.fromisoformat(entry['date'])
+
+        # Name formatting
+        if (net_precision := entry['date_precision']) is not None:
+            # Name with NET precision
+            name = net.strftime(
+                self.net_precision_formats.get(net_precision['id'], '')
+            ) + entry['name']
+        else:
+            name = '[TBD] ' + entry['name']
+
+        # Default duration if event type is not known
+        event_type = entry['type']['name']
+        if not event_type in self.event_duration:
+            event_type = 'default'
 
-    async def upcoming(self) -> dict[str, dict[str, bool and datetime and int and str]]:
+        # Duration timedelta using potential duration
+        if (duration := entry['duration']) is not None:
+            duration = parse_duration(duration)
+        else:
+            duration = self.event_duration[event_type]
+
+        # Check for videos
+        priority = None
+        picked_video = None
+        for url in entry['vid_urls']:
+            # Find lowest priority value
+            if priority is None or url['priority'] < priority:
+                priority = url['priority']
+                picked_video = url['url']
+
+        # Check description length and trim if needed
+        if ((description := entry['description']) is not None
+                and len(description) > self.max_description_length):
+            description = description[:self.max_description_length-3] + '...'
+
+        # Image format check
+        if ((image := entry['image']) is None or
+                (image_url := image['image_url']) and
+                not image_url.lower().endswith(self.image_formats)):
+            image_url = None
+
+        return str(entry['id']), LL2Event(
+            ll2_id=str(entry['id']),
+            name=name,
+            status=None,
+            description=description,
+            url=picked_video,
+            image_url=image_url,
+            start=net,
+            end=net + duration,
+            webcast_live=entry['webcast_live'],
+            slug=entry['slug'],
+            flightclub=False,
+            location=entry['location']
+        )
+
+    async def upcoming(self) -> dict[str, LL2Event]:
         """
         Gets data of upcoming events and launches.
 
         Returns
         -------
-        streams : dict[str, dict[str, bool and datetime and str]]
-            Dictionairy with the event name, webcast_live,
-            mission description, net time, video URL and LL2 ID.
+        streams : dict[str, LL2Event]
+            Upcoming events and launches per LL2 ID.
+
+        Notes
+        -----
+        When only the launches or events request fails,
+        the last snapshot of that request is used.
         """
-        launches = await self.upcoming_launches()
-        events = await self.upcoming_events()
+        # Request launches and events concurrently
+        request_count = self._ll2_request_count
+        launches, events = await asyncio.gather(
+            self.upcoming_launches(),
+            self.upcoming_events()
+        )
+        self._ll2_poll_requests = max(self._ll2_request_count - request_count, 1)
 
         # Only return when there are both launches and events
         if not ( launches and events ):
@@ -320,7 +536,7 @@ class LaunchLibrary2:
 
         # Sort by start datetime and limit it to `.max_events` items
         upcoming = dict(
-            sorted(upcoming.items(), key=lambda item: item[1]['start'])[:self.max_events]
+            sorted(upcoming.items(), key=lambda item: item[1].start)[:self.max_events]
         )
 
         # Update cache
@@ -328,3 +544,64 @@ class LaunchLibrary2:
 
         # Returning
         return upcoming
+
+    def poll_interval(
+        self,
+        upcoming: dict[str, LL2Event]
+    ) -> float:
+        """
+        Get the seconds until the next poll, depending
+        on how close the upcoming events are to T-0.
+
+        Parameters
+        ----------
+        upcoming : dict[str, LL2Event]
+            Upcoming events and launches, see `.upcoming()`.
+
+        Returns
+        -------
+        interval : float
+            Seconds until the next poll.
+
+        Notes
+        -----
+        The interval is never shorter than needed to
+        stay within `.ll2_hourly_budget` requests,
+        counting the requests of the last poll.
+        """
+        now = datetime.now(timezone.utc)
+        if any(
+            data.webcast_live or abs(data.start - now) <= self.poll_fast_window
+            for data in upcoming.values()
+        ):
+            interval = self.poll_intervals['fast']
+        elif not upcoming or any(
+            data.start - now <= self.poll_default_window
+            for data in upcoming.values()
+        ):
+            interval = self.poll_intervals['default']
+        else:
+            interval = self.poll_intervals['idle']
+
+        # Drop requests that left the one hour window
+        hour_ago = monotonic() - 3600
+        while self._ll2_requests and self._ll2_requests[0] <= hour_ago:
+            self._ll2_requests.popleft()
+
+        # Spread the budget evenly over the hour
+        interval = max(
+            interval,
+            3600 * self._ll2_poll_requests / self.ll2_hourly_budget
+        )
+        # Wait for old requests to leave the window when the budget is used
+        excess = (
+            len(self._ll2_requests)
+            + self._ll2_poll_requests
+            - self.ll2_hourly_budget
+        )
+        if excess > 0 and self._ll2_requests:
+            interval = max(
+                interval,
+                self._ll2_requests[min(excess, len(self._ll2_requests)) - 1] - hour_ago
+            )
+        return interval
@@ -0,0 +1,98 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any
+
+from bin.database import LL2Event
+
+@dataclass(frozen=True, slots=True)
+class LL2Change:
+    """
+    Cached LL2 event that is still upcoming,
+    together with its newer data.
+    """
+    cached: LL2Event
+    new: LL2Event
+    # New values of the changed stored fields, read-only
+    fields: Mapping[str, Any]
+
+    @property
+    def status(self) -> tuple[int | None, int | None] | None:
+        """
+        Old and new status, None when unchanged.
+        """
+        if 'status' in self.fields:
+            return self.cached.status, self.new.status
+
+    @property
+    def start(self) -> tuple[datetime, datetime] | None:
+        """
+        Old and new T-0, None when unchanged.
+        """
+        if 'start' in self.fields:
+            return self.cached.start, self.new.start
+
+
+@dataclass(frozen=True, slots=True)
+class LL2Changeset:
+    """
+    Differences between the cached LL2 events
+    and the upcoming ones of the LL2 API.
+
+    Notes
+    -----
+    Create one with `LL2Changeset.from_snapshots()`,
+    computing it has no side effects so the stages
+    applying it can run independently of each other.
+    """
+    # Upcoming events that aren't cached yet
+    added: tuple[LL2Event, ...] = ()
+    # Cached events that are no longer upcoming
+    removed: tuple[LL2Event, ...] = ()
+    # Cached events of which stored fields changed
+    changed: tuple[LL2Change, ...] = ()
+    # Newer data of cached events without changes
+    unchanged: tuple[LL2Event, ...] = ()
+
+    @classmethod
+    def from_snapshots(
+        cls,
+        cached: Mapping[str, LL2Event],
+        upcoming: Mapping[str, LL2Event]
+    ) -> 'LL2Changeset':
+        """
+        Compare the cached events with the upcoming events.
+
+        Parameters
+        ----------
+        cached : Mapping[str, LL2Event]
+            Cached events per LL2 ID.
+        upcoming : Mapping[str, LL2Event]
+            Upcoming events per LL2 ID.
+
+        Returns
+        -------
+        changeset : LL2Changeset
+            Differences between both snapshots.
+        """
+        removed, changed, unchanged = [], [], []
+        for ll2_id, event in cached.items():
+            if (new := upcoming.get(ll2_id)) is None:
+                removed.append(event)
+            elif fields := event.diff(new):
+                changed.append(
+                    LL2Change(event, new, MappingProxyType(fields))
+                )
+            else:
+                unchanged.append(new)
+        return cls(
+            added=tuple(
+                event for ll2_id, event in upcoming.items()
+                if ll2_id not in cached
+            ),
+            removed=tuple(removed),
+            changed=tuple(changed),
+            unchanged=tuple(unchanged)
+        )
+
@@ -1,10 +1,7 @@
 import asyncio
 from bs4 import BeautifulSoup
-import json
-import os
-from os.path import isfile
 
-from bin import get
+from bin import get, JSONConfig, NOT_MODIFIED
 
 class NASATV:
     """
@@ -18,6 +15,16 @@ class NASATV:
         # NASA TV
         self._nasatv_file = 'LiveLaunch_NASATV.json'
         self._nasatv_url = 'https://www.nasa.gov/nasatv/'
+        # Default NASA TV URLs
+        nasatv_default = ['https://www.youtube.com/watch?v=21X5lGlDOfg', \
+                          'https://www.youtube.com/watch?v=nA9UZF-SZoQ']
+        # Cached loader, reparses the file only when it changes
+        self._nasatv_config = JSONConfig(
+            self._nasatv_file,
+            {'nasatv': nasatv_default},
+            self._parse_nasatv
+        )
+        self.nasatv = self._nasatv_config.snapshot
 
     def __contains__(self, url: str) -> bool:
         """
@@ -36,32 +43,44 @@ class NASATV:
         """
         return url in self.nasatv
 
-    def _defaultNASAlive(self) -> None:
+    def _parse_nasatv(self, data: dict) -> tuple[str, ...]:
+        """
+        Validates the `._nasatv_file` json data.
+
+        Parameters
+        ----------
+        data : dict
+            Loaded `._nasatv_file` json data.
+
+        Returns
+        -------
+        nasatv : tuple[str, ...]
+            NASA TV YouTube stream URLs.
+
+        Raises
+        ------
+        ValueError
+            When the data doesn't match the expected format.
+        """
+        nasatv = data['nasatv']
+        if not (
+            isinstance(nasatv, list)
+            and all(isinstance(i, str) for i in nasatv)
+        ):
+            raise ValueError(f'Invalid format of {self._nasatv_file}')
+        return tuple(nasatv)
+
+    async def _defaultNASAlive(self) -> None:
         """
-        Reads the `._nasatv_file` json file
-        and sets the `.nasatv` variable.
+        Reads the `._nasatv_file` json file when it
+        changed and sets the `.nasatv` variable.
 
         Notes
         -----
         Stores the NASA TV YouTube stream
         URLs into the `.nasatv` variable.
         """
-        # Default NASA TV URLs
-        nasatv_default = ['https://www.youtube.com/watch?v=21X5lGlDOfg', \
-                          'https://www.youtube.com/watch?v=nA9UZF-SZoQ']
-        # Open self._nasatv_file json to find previously found NASA TV URLs
-        if isfile(self._nasatv_file):
-            with open(self._nasatv_file, 'r', encoding='utf-8') as f:
-                f = json.load(f)
-            try:
-                self.nasatv = f['nasatv']
-            except:
-                self.nasatv = nasatv_default
-        # If self._nasatv_file json doesn't exist, create one with the defaults
-        else:
-            self.nasatv = nasatv_default
-            with open(self._nasatv_file, 'w', encoding='utf-8') as f:
-                json.dump({'nasatv': self.nasatv}, f, indent=2)
+        self.nasatv = await self._nasatv_config.load()
 
     async def _findNASAlive(self) -> None:
         """
@@ -75,10 +94,10 @@ class NASATV:
         Stores the NASA TV YouTube stream
         URLs into the `.nasatv` variable.
         """
-        soup = BeautifulSoup(
-            await get(self._nasatv_url),
-            features='html.parser'
-        )
+        # Nothing to find when the page didn't change
+        if (page := await get(self._nasatv_url, conditional=True)) is NOT_MODIFIED:
+            return
+        soup = BeautifulSoup(page, features='html.parser')
         search = soup.find_all(
             'a',
             class_='button-primary button-primary-sm link-external-true'
@@ -90,16 +109,15 @@ class NASATV:
         # Only continue if there are new NASA TV streams
         if newstreams:
             # Add new streams
-            self.nasatv += newstreams
+            self.nasatv += tuple(newstreams)
             # Store new NASA TV streams in the self._nasatv_file json
-            with open(self._nasatv_file, 'w', encoding='utf-8') as f:
-                json.dump({'nasatv': self.nasatv}, f, indent=2)
+            await self._nasatv_config.write({'nasatv': list(self.nasatv)})
 
     async def update(self) -> None:
         """
         Updates the object if there are any new NASA TV streams found.
         """
         # Read json containing NASA TV streams
-        self._defaultNASAlive()
+        await self._defaultNASAlive()
         # Get NASA TV live streams
         await self._findNASAlive()
@@ -0,0 +1,87 @@
+import asyncio
+from collections.abc import AsyncIterable, Coroutine, Iterable
+import logging
+
+logger = logging.getLogger(__name__)
+
+class BoundedRunner:
+    """
+    Runs coroutines concurrently with
+    a maximum amount at the same time.
+
+    Notes
+    -----
+    Call the object with an (async) iterable of
+    coroutines, they are pulled from the iterable
+    lazily, at most `.concurrency` coroutines are
+    running at the same time.
+    """
+    def __init__(self, concurrency: int, description: str = 'task') -> None:
+        """
+        Parameters
+        ----------
+        concurrency : int
+            Maximum amount of simultaneous coroutines.
+        description : str, default: 'task'
+            What a coroutine does, used when logging errors.
+        """
+        self.concurrency = concurrency
+        self.description = description
+
+    async def __call__(
+        self,
+        coroutines: AsyncIterable[Coroutine] | Iterable[Coroutine]
+    ) -> None:
+        """
+        Run all coroutines concurrently and
+        wait until every coroutine finished.
+
+        Parameters
+        ----------
+        coroutines : AsyncIterable[Coroutine] or Iterable[Coroutine]
+            Coroutines to run.
+
+        Notes
+        -----
+        Coroutines should handle their own expected
+        errors, unexpected errors are logged so one
+        failing coroutine never stops the others.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(coroutine: Coroutine) -> None:
+            try:
+                await coroutine
+            except Exception as e:
+                logger.error(
+                    f'Error during {self.description}: {e}, {type(e)}'
+                )
+            finally:
+                semaphore.release()
+
+        async with asyncio.TaskGroup() as tg:
+            # Turn regular iterables into an async one
+            if not isinstance(coroutines, AsyncIterable):
+                coroutines = self._aiter(coroutines)
+            async for coroutine in coroutines:
+                # Wait for a free slot before starting the next one
+                await semaphore.acquire()
+                tg.create_task(run(coroutine))
+
+    @staticmethod
+    async def _aiter(iterable: Iterable[Coroutine]) -> AsyncIterable[Coroutine]:
+        """
+        Wrap an iterable into an async iterable.
+
+        Parameters
+        ----------
+        iterable : Iterable[Coroutine]
+            Iterable to wrap.
+
+        Yields
+        ------
+        item : Coroutine
+            Items of the iterable.
+        """
+        for item in iterable:
+            yield item
@@ -2,7 +2,7 @@ import asyncio
 from datetime import datetime, timedelta, timezone
 from operator import itemgetter
 
-from bin import get
+from bin import get, NOT_MODIFIED
 
 class SpaceflightNewsAPI:
     """
@@ -32,10 +32,10 @@ class SpaceflightNewsAPI:
         after last call or object creation.
         """
         # Request data
-        news = await get(self.snapi_url, json=True)
+        news = await get(self.snapi_url, json=True, conditional=True)
 
-        # Retun empty list when failed
-        if not news['results']:
+        # Retun empty list when unchanged or failed
+        if news is NOT_MODIFIED or not news['results']:
             return []
 
         # Datetime object to compare with
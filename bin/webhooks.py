@@ -0,0 +1,227 @@
+import aiohttp
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Sized
+from contextlib import asynccontextmanager
+import logging
+import re
+from time import monotonic
+from weakref import WeakValueDictionary
+
+from bin.runner import BoundedRunner
+
+logger = logging.getLogger(__name__)
+
+def combine_embeds(
+    embeds: Iterable[Sized],
+    max_embeds: int = 10,
+    max_length: int = 6000
+) -> list[list[Sized]]:
+    """
+    Combine embeds into batches that each
+    fit within a single webhook message.
+
+    Parameters
+    ----------
+    embeds : Iterable[discord.Embed]
+        Embeds to combine.
+    max_embeds : int, default: 10
+        Maximum amount of embeds per message.
+    max_length : int, default: 6000
+        Maximum total amount of characters
+        of all embeds within a message.
+
+    Returns
+    -------
+    result : list[list[discord.Embed]]
+        A list of embed batches, one per message.
+
+    Notes
+    -----
+    An embed larger than the maximum length
+    is put in a batch of its own, batches
+    are never empty.
+    """
+    combined = []
+    combined_length = 0
+    result = []
+
+    for embed in embeds:
+        # Count characters of the current embed
+        length = len(embed)
+        # Currently still within the message limits
+        if len(combined) < max_embeds and combined_length + length <= max_length:
+            combined.append(embed)
+            combined_length += length
+        # Outside of the limits, starting a new message
+        else:
+            if combined:
+                result.append(combined)
+            combined = [embed]
+            combined_length = length
+
+    # Add final batch
+    if combined:
+        result.append(combined)
+
+    return result
+
+
+class WebhookFanout(BoundedRunner):
+    """
+    Bounded-concurrency fan-out engine for
+    sending webhook messages to many guilds.
+
+    Notes
+    -----
+    Call the object with an (async) iterable of
+    coroutines, each coroutine delivers the messages
+    of one guild. Coroutines are pulled from the
+    iterable lazily, at most `.concurrency`
+    coroutines are running at the same time.
+    """
+    def __init__(self, concurrency: int = 25) -> None:
+        """
+        Parameters
+        ----------
+        concurrency : int, default: 25
+            Maximum amount of simultaneous deliveries.
+        """
+        super().__init__(concurrency, 'webhook delivery')
+
+
+class WebhookRateLimiter:
+    """
+    Delivery scheduler that keeps webhook sends
+    within Discord's rate limits, so sends wait
+    for a free slot instead of running into 429s.
+
+    Notes
+    -----
+    Rate limit buckets are tracked per webhook
+    from the response headers using `.trace_config`,
+    which has to be attached to the session the
+    webhooks send with. Wrap every send like so:
+
+    >>> async with limiter(webhook_url):
+    ...    await webhook.send(...)
+    """
+    def __init__(self, global_rate: int = 50) -> None:
+        """
+        Parameters
+        ----------
+        global_rate : int, default: 50
+            Maximum amount of requests per second.
+        """
+        self.global_rate = global_rate
+        # Webhook ID from webhook and API URLs
+        self._webhook_id = re.compile(r'/webhooks/(\d+)').search
+        # Webhook ID: [remaining requests, monotonic reset time]
+        self._buckets: dict[str, list[int | float]] = {}
+        # Per webhook locks, removed automatically when unused
+        self._locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+        # Monotonic times of the sends within the last second
+        self._global_window: deque[float] = deque()
+        self._global_lock = asyncio.Lock()
+        # Monotonic time until a global rate limit is lifted
+        self._global_reset = 0.0
+        # Trace config to read the rate limit headers
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_end.append(self._on_request_end)
+
+    @asynccontextmanager
+    async def __call__(self, webhook_url: str) -> AsyncIterator[None]:
+        """
+        Wait until the webhook can be sent
+        to without hitting a rate limit.
+
+        Parameters
+        ----------
+        webhook_url : str
+            Discord webhook URL.
+        """
+        webhook_id = (match := self._webhook_id(webhook_url)) and match[1]
+        # Only one request per webhook at a time
+        if (lock := self._locks.get(webhook_id)) is None:
+            lock = self._locks[webhook_id] = asyncio.Lock()
+        async with lock:
+            await self._wait_bucket(webhook_id)
+            await self._wait_global()
+            yield
+
+    async def _wait_bucket(self, webhook_id: str) -> None:
+        """
+        Wait until the webhook's bucket resets
+        when it has no requests remaining.
+
+        Parameters
+        ----------
+        webhook_id : str
+            Discord webhook ID.
+        """
+        if (bucket := self._buckets.get(webhook_id)) is None:
+            return
+        remaining, reset = bucket
+        if (delay := reset - monotonic()) <= 0:
+            # Bucket has been reset
+            del self._buckets[webhook_id]
+        elif remaining <= 0:
+            await asyncio.sleep(delay)
+            self._buckets.pop(webhook_id, None)
+        else:
+            # Account for this request until the headers update it
+            bucket[0] -= 1
+
+    async def _wait_global(self) -> None:
+        """
+        Wait until a request fits in the global rate.
+        """
+        async with self._global_lock:
+            while True:
+                now = monotonic()
+                # Drop sends that left the one second window
+                while self._global_window and self._global_window[0] <= now - 1:
+                    self._global_window.popleft()
+                if now < self._global_reset:
+                    await asyncio.sleep(self._global_reset - now)
+                elif len(self._global_window) >= self.global_rate:
+                    await asyncio.sleep(self._global_window[0] + 1 - now)
+                else:
+                    self._global_window.append(now)
+                    return
+
+    async def _on_request_end(
+        self,
+        session: aiohttp.ClientSession,
+        trace_config_ctx: object,
+        params: aiohttp.TraceRequestEndParams
+    ) -> None:
+        """
+        Update the rate limit buckets
+        with the response headers.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            Session that made the request.
+        trace_config_ctx : object
+            Trace context.
+        params : aiohttp.TraceRequestEndParams
+            Request and response data.
+        """
+        if not (match := self._webhook_id(params.url.path)):
+            return
+        headers = params.response.headers
+        now = monotonic()
+
+        # Global rate limit, block all webhooks
+        if params.response.status == 429 and headers.get('X-RateLimit-Global'):
+            self._global_reset = now + float(headers.get('Retry-After', 1))
+            return
+
+        # Store the bucket of the webhook
+        if (
+            (remaining := headers.get('X-RateLimit-Remaining')) is not None
+            and (reset_after := headers.get('X-RateLimit-Reset-After')) is not None
+        ):
+            self._buckets[match[1]] = [int(remaining), now + float(reset_after)]
@@ -1,5 +1,16 @@
-from googleapiclient.discovery import build
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta, timezone
+import json
+import logging
+import os
 from os import getenv
+from typing import Any
+from urllib.parse import urlencode
+
+from bin import get, TTLCache
+
+logger = logging.getLogger(__name__)
 
 class YouTubeAPI:
     """
@@ -10,29 +21,360 @@ class YouTubeAPI:
     -----
     Available methods:
         `.get_channel_thumbtitle()`
+        `.get_channels_thumbtitle()`
         `.get_channel_from_video()`
+        `.get_channels_from_videos()`
+
+    The quota units used today are tracked per
+    endpoint, see `.quota_used` and `.quota_total`,
+    and kept across restarts in `.quota_path`.
+    Cached values are used instead of refreshing
+    them when the quota nears its limit, lookups
+    without a cached value are deferred only when
+    the quota is fully used.
     """
     def __init__(self):
         # Youtube v3 API
         self._key = getenv('YOUTUBE_KEY')
-        self._API_SERVICE_NAME = 'youtube'
-        self._API_VERSION = 'v3'
-        # Authenticate
-        self._get_authenticated_service()
+        self._API_URL = 'https://www.googleapis.com/youtube/v3/%s?%s'
+        # Seconds before a request is abandoned
+        self.timeout = 10
+        # Maximum amount of IDs per request
+        self.max_ids = 50
+        # Channel thumbnails & titles, kept across restarts
+        self._thumbtitle_cache = TTLCache(
+            maxsize=256,
+            ttl=86400,
+            path=getenv('YOUTUBE_CACHE_PATH', 'LiveLaunch_YouTubeCache.json')
+        )
+        # Channels of videos, these never change
+        self._video_channel_cache = TTLCache(maxsize=1024, ttl=604800)
+        # Daily quota units and the cost of a request per endpoint
+        self.quota_limit = int(getenv('YOUTUBE_QUOTA', 10000))
+        self.quota_costs = {'channels': 1, 'search': 100, 'videos': 1}
+        # Fraction of the quota kept for lookups without a cached value
+        self.quota_reserve = 0.2
+        # Endpoint: quota units used today
+        self.quota_used: dict[str, int] = {}
+        # Quota resets at midnight Pacific Time, DST is ignored
+        self._quota_tz = timezone(timedelta(hours=-8))
+        self._quota_day = self._quota_today()
+        # Used quota of the day, kept across restarts
+        self.quota_path = getenv('YOUTUBE_QUOTA_PATH', 'LiveLaunch_YouTubeQuota.json')
+        self._quota_load()
+
+    def _quota_today(self) -> date:
+        """
+        Get the current day of the quota.
+
+        Returns
+        -------
+        day : date
+            Current day in Pacific Time.
+        """
+        return datetime.now(self._quota_tz).date()
+
+    def _quota_load(self) -> None:
+        """
+        Load the quota used today by
+        a previous run, if there is any.
+        """
+        if not self.quota_path or not os.path.isfile(self.quota_path):
+            return
+        try:
+            with open(self.quota_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if date.fromisoformat(stored['day']) == self._quota_day:
+                self.quota_used = {
+                    resource: int(used)
+                    for resource, used in stored['used'].items()
+                }
+        except Exception as e:
+            logger.warning(
+                f'Cannot load YouTube quota {self.quota_path}: {e}, {type(e)}'
+            )
+
+    async def _quota_save(self) -> None:
+        """
+        Store the quota used today in `.quota_path`,
+        failures are logged.
+        """
+        if not self.quota_path:
+            return
+        data = json.dumps({
+            'day': self._quota_day.isoformat(),
+            'used': self.quota_used
+        })
+
+        def write() -> None:
+            with open(self.quota_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+
+        try:
+            await asyncio.to_thread(write)
+        except OSError as e:
+            logger.warning(
+                f'Cannot save YouTube quota {self.quota_path}: {e}, {type(e)}'
+            )
+
+    def _quota_reset(self) -> None:
+        """
+        Reset the used quota when a new quota day started.
+        """
+        if (today := self._quota_today()) != self._quota_day:
+            self.quota_used = {}
+            self._quota_day = today
+
+    @property
+    def quota_total(self) -> int:
+        """
+        Quota units used today by all endpoints.
+        """
+        self._quota_reset()
+        return sum(self.quota_used.values())
 
-    def _get_authenticated_service(self) -> None:
+    def quota_allows(
+        self,
+        resource: str,
+        requests: int = 1,
+        *,
+        refresh: bool = False
+    ) -> bool:
         """
-        Logs into the YouTube API using the API key.
+        Check whether requests fit in today's quota.
+
+        Parameters
+        ----------
+        resource : str
+            API resource, e.g. `videos`.
+        requests : int, default: 1
+            Amount of requests to make.
+        refresh : bool, default: False
+            Whether the requests only refresh cached
+            values, these can't use the reserved quota.
+
+        Returns
+        -------
+        allowed : bool
+            Whether the requests can be made.
+        """
+        limit = self.quota_limit
+        if refresh:
+            limit *= 1 - self.quota_reserve
+        cost = requests * self.quota_costs.get(resource, 1)
+        return self.quota_total + cost <= limit
+
+    async def _request(self, resource: str, **params: str | int) -> dict:
+        """
+        Requests a resource of the YouTube API
+        using the shared session.
+
+        Parameters
+        ----------
+        resource : str
+            API resource, e.g. `videos`.
+        **params : str or int
+            Query parameters of the request.
+
+        Returns
+        -------
+        response : dict
+            Decoded JSON response.
+
+        Raises
+        ------
+        TimeoutError
+            When the request takes longer than `.timeout`.
+        """
+        params['key'] = self._key
+        # Requests use quota even when they fail
+        self._quota_reset()
+        self.quota_used[resource] = (
+            self.quota_used.get(resource, 0)
+            + self.quota_costs.get(resource, 1)
+        )
+        return await asyncio.wait_for(
+            get(
+                self._API_URL % (resource, urlencode(params)),
+                json=True
+            ),
+            self.timeout
+        )
+
+    async def _request_batched(
+        self,
+        resource: str,
+        ids: list[str],
+        **params: str | int
+    ) -> list[dict]:
+        """
+        Requests a resource for many IDs, using
+        as few concurrent requests as possible.
+
+        Parameters
+        ----------
+        resource : str
+            API resource, e.g. `videos`.
+        ids : list[str]
+            IDs to request.
+        **params : str or int
+            Query parameters of the request.
+
+        Returns
+        -------
+        items : list[dict]
+            Returned items of all successful requests.
+        """
+        ids = list(dict.fromkeys(ids))
+        responses = await asyncio.gather(
+            *[
+                self._request(
+                    resource,
+                    id=','.join(ids[i:i + self.max_ids]),
+                    **params
+                )
+                for i in range(0, len(ids), self.max_ids)
+            ],
+            return_exceptions=True
+        )
+        return [
+            item
+            for response in responses if isinstance(response, dict)
+            for item in response.get('items', [])
+        ]
+
+    async def _cached(
+        self,
+        cache: TTLCache,
+        resource: str,
+        ids: list[str],
+        request: Callable[[list[str]], Awaitable[dict[str, Any]]]
+    ) -> tuple[dict[str, Any], list[str]]:
+        """
+        Get values from the cache and request
+        the missing ones, failures are cached too.
+        Expired values are used as long as the
+        quota doesn't allow refreshing them.
+
+        Parameters
+        ----------
+        cache : TTLCache
+            Cache to use.
+        resource : str
+            API resource requested, e.g. `videos`.
+        ids : list[str]
+            IDs to get the values of.
+        request : Callable[[list[str]], Awaitable[dict[str, Any]]]
+            Coroutine function requesting
+            a dictionary of the missing IDs.
+
+        Returns
+        -------
+        (values, deferred) : tuple[dict[str, Any], list[str]]
+            Values per ID, failed and deferred IDs are left out,
+            and the IDs deferred because the quota is used.
+        """
+        values, missing, deferred = {}, [], []
+        for id in dict.fromkeys(ids):
+            if id in cache:
+                if (value := cache[id]) is not None:
+                    values[id] = value
+            else:
+                missing.append(id)
+
+        # Keep using expired values while refreshing doesn't fit the quota
+        if missing and not self.quota_allows(
+            resource,
+            -(-len(missing) // self.max_ids),
+            refresh=True
+        ):
+            for id in missing:
+                if (value := cache.get_stale(id)) is not None:
+                    values[id] = value
+            missing = [id for id in missing if id not in values]
+
+        # Defer new lookups when the quota is fully used
+        if missing and not self.quota_allows(
+            resource,
+            -(-len(missing) // self.max_ids)
+        ):
+            logger.warning(
+                f'YouTube API quota used ({self.quota_total}/{self.quota_limit}),'
+                f' deferring {len(missing)} {resource} lookups'
+            )
+            missing, deferred = [], missing
+
+        if missing:
+            requested = await request(missing)
+            for id in missing:
+                # Store failures as None
+                cache[id] = requested.get(id)
+            values |= requested
+            # Persist the new entries and the used quota
+            await cache.save()
+            await self._quota_save()
+
+        return values, deferred
+
+    async def get_channels_thumbtitle(self, ids: list[str]) -> dict[str, tuple[str, str]]:
+        """
+        Retrieves thumbnail URLs and titles for many YouTube channel IDs.
+
+        Parameters
+        ----------
+        ids : list[str]
+            YouTube channel IDs.
+
+        Returns
+        -------
+        thumbtitles : dict[str, tuple[str, str]]
+            Returns the thumbnail and channel title per channel ID,
+            channels that can't be found are left out.
 
         Notes
         -----
-        Stores the API access resource ``googleapiclient.discovery.build``
-        into the `.youtube` variable.
+        Results are cached, see `._thumbtitle_cache`.
         """
-        self.youtube = build(self._API_SERVICE_NAME, self._API_VERSION, \
-            developerKey=self._key)
+        thumbtitles, _ = await self._cached(
+            self._thumbtitle_cache,
+            'channels',
+            ids,
+            self._request_channels_thumbtitle
+        )
+        return {id: tuple(thumbtitle) for id, thumbtitle in thumbtitles.items()}
 
-    def get_channel_thumbtitle(self, id: str) -> dict[str, str] or None:
+    async def _request_channels_thumbtitle(self, ids: list[str]) -> dict[str, tuple[str, str]]:
+        """
+        Requests thumbnail URLs and titles for many YouTube channel IDs.
+
+        Parameters
+        ----------
+        ids : list[str]
+            YouTube channel IDs.
+
+        Returns
+        -------
+        thumbtitles : dict[str, tuple[str, str]]
+            Returns the thumbnail and channel title per channel ID,
+            channels that can't be found are left out.
+        """
+        thumbtitles = {}
+        for item in await self._request_batched(
+            'channels',
+            ids,
+            part='snippet',
+            fields='items(id,snippet(title,thumbnails/default/url))'
+        ):
+            try:
+                thumbtitles[item['id']] = (
+                    item['snippet']['thumbnails']['default']['url'],
+                    item['snippet']['title']
+                )
+            except KeyError:
+                continue
+        return thumbtitles
+
+    async def get_channel_thumbtitle(self, id: str) -> tuple[str, str] or None:
         """
         Retrieves a thumbnail URL and title for a given YouTube channel ID.
 
@@ -46,19 +388,9 @@ class YouTubeAPI:
         (thumb, title) : tuple of two strings or None
             Returns the thumbnail and channel title or None if it fails.
         """
-        try:
-            response = self.youtube.channels().list(
-                part='snippet',
-                id=id,
-                fields='items/snippet(title,thumbnails/default/url)'
-            ).execute()
-            thumb = response['items'][0]['snippet']['thumbnails']['default']['url']
-            title = response['items'][0]['snippet']['title']
-            return thumb, title
-        except:
-            return None
+        return (await self.get_channels_thumbtitle([id])).get(id)
 
-    def get_channel_broadcasts(self, id: str, eventType: str = 'upcoming', maxResults: int = 8) -> list[str] or None:
+    async def get_channel_broadcasts(self, id: str, eventType: str = 'upcoming', maxResults: int = 8) -> list[str] or None:
         """
         #### DEPRECATED ####
 
@@ -79,19 +411,78 @@ class YouTubeAPI:
             Returns a list containing URLs or None if it fails.
         """
         try:
-            response = self.youtube.search().list(
+            response = await self._request(
+                'search',
                 part='snippet',
                 channelId=id,
                 eventType=eventType,
                 maxResults=maxResults,
                 type='video',
                 fields='items/id/videoId'
-            ).execute()
+            )
             return [f"https://www.youtube.com/watch?v={i['id']['videoId']}" for i in response['items']]
         except:
             return None
 
-    def get_channel_from_video(self, id: str) -> str or None:
+    async def get_channels_from_videos(
+        self,
+        ids: list[str]
+    ) -> tuple[dict[str, str], list[str]]:
+        """
+        Uses YouTube video IDs to find the corresponding channel IDs.
+
+        Parameters
+        ----------
+        ids : list[str]
+            YouTube video IDs.
+
+        Returns
+        -------
+        (channels, deferred) : tuple[dict[str, str], list[str]]
+            Returns the channel ID per video ID, videos
+            that can't be found are left out, and the
+            video IDs not looked up because the quota is used.
+
+        Notes
+        -----
+        Results are cached, see `._video_channel_cache`.
+        """
+        return await self._cached(
+            self._video_channel_cache,
+            'videos',
+            ids,
+            self._request_channels_from_videos
+        )
+
+    async def _request_channels_from_videos(self, ids: list[str]) -> dict[str, str]:
+        """
+        Requests the channel IDs of many YouTube video IDs.
+
+        Parameters
+        ----------
+        ids : list[str]
+            YouTube video IDs.
+
+        Returns
+        -------
+        channels : dict[str, str]
+            Returns the channel ID per video ID,
+            videos that can't be found are left out.
+        """
+        channels = {}
+        for item in await self._request_batched(
+            'videos',
+            ids,
+            part='snippet',
+            fields='items(id,snippet/channelId)'
+        ):
+            try:
+                channels[item['id']] = item['snippet']['channelId']
+            except KeyError:
+                continue
+        return channels
+
+    async def get_channel_from_video(self, id: str) -> str or None:
         """
         Uses a YouTube video ID to find the corresponding channel ID.
 
@@ -103,14 +494,7 @@ class YouTubeAPI:
         Returns
         -------
         channel : str or None
-            Returns a string containing the channel ID or None if it fails. 
+            Returns a string containing the channel ID or None if it fails.
         """
-        try:
-            response = self.youtube.videos().list(
-                part='snippet',
-                id=id,
-                fields='items/snippet/channelId'
-            ).execute()
-            return response['items'][0]['snippet']['channelId']
-        except:
-            return None
\ No newline at end of file
+        channels, _ = await self.get_channels_from_videos([id])
+        return channels.get(id)
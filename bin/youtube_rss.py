@@ -1,11 +1,38 @@
 import asyncio
-from bs4 import BeautifulSoup
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timezone
-import json
-from os.path import isfile
+from io import BytesIO
+import logging
+from lxml import etree
 import re
+from types import MappingProxyType
 
-from bin import get
+from bin import get, JSONConfig, NOT_MODIFIED, shared_session
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class YouTubeChannels:
+    """
+    Immutable snapshot of the
+    `LiveLaunch_YouTube.json` file.
+
+    Attributes
+    ----------
+    channels : tuple[str]
+        YouTube channel IDs to check.
+    agency_ids : Mapping[str, int]
+        LL2 agency ID per channel.
+    keyword_matchers : Mapping[str, Callable]
+        Compiled keywords per channel.
+    ignore_matchers : Mapping[str, Callable]
+        Compiled ignore words per channel.
+    """
+    channels: tuple[str, ...]
+    agency_ids: Mapping[str, int]
+    keyword_matchers: Mapping[str, Callable[[str], re.Match | None]]
+    ignore_matchers: Mapping[str, Callable[[str], re.Match | None]]
 
 class YouTubeRSS:
     """
@@ -20,46 +47,82 @@ class YouTubeRSS:
     def __init__(self):
         # YouTube channels & keywords
         self.ytfile = 'LiveLaunch_YouTube.json'
+        # Maximum amount of feeds to request at once
+        self.max_concurrent_feeds = 8
+        # Seconds before a feed request is abandoned
+        self.feed_timeout = 15
+        # RSS feed of a channel
+        self._feed_url = 'https://www.youtube.com/feeds/videos.xml?channel_id=%s'
+        # Channel: parsed entries of the last feed, filtered
+        # again when the feed didn't change
+        self._entries: dict[str, list[tuple[str, str, str, str]]] = {}
+        # Atom and YouTube XML namespaces used by the RSS feeds
+        self._atom_ns = '{http://www.w3.org/2005/Atom}'
+        self._yt_ns = '{http://www.youtube.com/xml/schemas/2015}'
+        # Cached loader, reparses the file only when it changes
+        self._config = JSONConfig(
+            self.ytfile,
+            {
+                'channels': [],
+                'keywords': {},
+                'ignore': {},
+                'agency_ids': {}
+            },
+            self._parse_channel_list
+        )
+        self.config = self._config.snapshot
 
-    def _get_channel_list(self) -> None:
+    def _parse_channel_list(self, data: dict) -> YouTubeChannels:
         """
-        Opens the `.ytfile` json file to see what YouTube channels to check and
-        their keywords to find livestreams.
+        Validates the `.ytfile` json data and compiles the keywords
+        and ignore words of every channel into one regex each.
 
-        Notes
-        -----
-        Stores the data into the `.channels` and `.keywords` variables.
+        Parameters
+        ----------
+        data : dict
+            Loaded `.ytfile` json data.
+
+        Returns
+        -------
+        config : YouTubeChannels
+            Snapshot with the channels, their
+            agency IDs and compiled matchers.
+
+        Raises
+        ------
+        ValueError
+            When the data doesn't match the expected format.
         """
-        if isfile(self.ytfile):
-            with open(self.ytfile, 'r', encoding='utf-8') as f:
-                f = json.load(f)
-            try:
-                self.channels = f['channels']
-                self.keywords = f['keywords']
-                self.ignore = f['ignore']
-                self.agency_ids = f['agency_ids']
-            except:
-                self.channels = []
-                self.keywords = {}
-                self.ignore = {}
-                self.agency_ids = {}
-        else:
-            with open(self.ytfile, 'w', encoding='utf-8') as f:
-                json.dump(
-                    {
-                        'channels': [],
-                        'keywords': {},
-                        'ignore': {},
-                        'agency_ids': {}
-                    },
-                    f, indent=2
-                )
-            self.channels = []
-            self.keywords = {}
-            self.ignore = {}
-            self.agency_ids = {}
-
-    async def _requestRSS(self, channel: str) -> BeautifulSoup:
+        channels = data['channels']
+        keywords, ignore = data['keywords'], data['ignore']
+        agency_ids = data['agency_ids']
+        # Validate the format
+        if not (
+            isinstance(channels, list)
+            and all(isinstance(i, str) for i in channels)
+            and all(
+                isinstance(words, list)
+                and all(isinstance(i, str) for i in words)
+                for words in (*keywords.values(), *ignore.values())
+            )
+            and all(isinstance(i, int) for i in agency_ids.values())
+        ):
+            raise ValueError(f'Invalid format of {self.ytfile}')
+
+        return YouTubeChannels(
+            channels=tuple(channels),
+            agency_ids=MappingProxyType(dict(agency_ids)),
+            keyword_matchers=MappingProxyType({
+                channel: self._findWholeWord(words)
+                for channel, words in keywords.items() if words
+            }),
+            ignore_matchers=MappingProxyType({
+                channel: self._findWholeWord(words)
+                for channel, words in ignore.items() if words
+            })
+        )
+
+    async def _requestRSS(self, channel: str) -> bytes or NOT_MODIFIED:
         """
         Requests the RSS feed of the requested channel.
 
@@ -70,21 +133,59 @@ class YouTubeRSS:
 
         Returns
         -------
-        soup : bs4.BeautifulSoup
-            Returns a soup object containing the RSS feed entries.
+        feed : bytes or NOT_MODIFIED
+            Returns the encoded RSS feed or
+            `NOT_MODIFIED` when the feed didn't change.
         """
-        f = f'https://www.youtube.com/feeds/videos.xml?channel_id={channel}'
-        soup = BeautifulSoup(await get(f), features='xml')
-        return soup
+        f = self._feed_url % channel
+        if (feed := await get(f, conditional=True)) is NOT_MODIFIED:
+            return feed
+        return feed.encode('utf-8')
 
-    def _findWholeWord(self, word: str) -> re.Pattern:
+    def _parseRSS(self, feed: bytes) -> Iterator[tuple[str, str, str, str]]:
         """
-        Searches for a word in the returned regex callable.
+        Streams the entries of an RSS feed,
+        only keeping the required fields.
 
         Parameters
         ----------
-        word : str
-            Search word.
+        feed : bytes
+            Encoded RSS feed.
+
+        Yields
+        ------
+        tuple[
+            video_id : str,
+            title : str,
+            published : str,
+            updated : str
+        ]
+            Yields the fields of every entry.
+        """
+        for _, entry in etree.iterparse(
+            BytesIO(feed),
+            events=('end',),
+            tag=f'{self._atom_ns}entry'
+        ):
+            yield (
+                entry.findtext(f'{self._yt_ns}videoId'),
+                entry.findtext(f'{self._atom_ns}title'),
+                entry.findtext(f'{self._atom_ns}published'),
+                entry.findtext(f'{self._atom_ns}updated')
+            )
+            # Free the parsed entry and the ones before it
+            entry.clear()
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+
+    def _findWholeWord(self, words: list[str]) -> re.Pattern:
+        """
+        Searches for any of the words in the returned regex callable.
+
+        Parameters
+        ----------
+        words : list[str]
+            Search words.
 
         Returns
         -------
@@ -93,10 +194,12 @@ class YouTubeRSS:
 
         Notes
         -----
-        The returned regex pattern ignores upper- and lowercase.
+        The returned regex pattern ignores upper- and lowercase,
+        the words are combined into a single alternation.
         """
-        return re.compile(r'\b({})\b'.format(word), \
-            flags=re.IGNORECASE).search
+        return re.compile(r'\b(?:{})\b'.format(
+            '|'.join(f'(?:{word})' for word in words)
+        ), flags=re.IGNORECASE).search
 
     async def _get_channel_broadcastsRSS(self, channel: str, maxdaysago: int = 2) -> list[str]:
         """
@@ -113,25 +216,38 @@ class YouTubeRSS:
         -------
         streams : list containing strings
             Returns a list containing YouTube video IDs.
+
+        Notes
+        -----
+        The entries of an unchanged feed are filtered again,
+        so changed keywords also apply to videos in it.
         """
-        soup = await self._requestRSS(channel)
+        feed = await self._requestRSS(channel)
+        # Unchanged feed without kept entries, request it in full
+        if feed is NOT_MODIFIED and channel not in self._entries:
+            shared_session.validators.pop(self._feed_url % channel, None)
+            feed = await self._requestRSS(channel)
+        # Changed feed, keep its entries for when it doesn't change
+        if feed is not NOT_MODIFIED:
+            self._entries[channel] = list(self._parseRSS(feed))
         streams = []
+        # Keyword and ignore matchers of the channel
+        if not (keywords := self.config.keyword_matchers.get(channel)):
+            return streams
+        ignore = self.config.ignore_matchers.get(channel)
         # Get current time
         now = datetime.now(timezone.utc)
-        for entry in soup.find_all('entry'):
+        for video_id, title, published, updated in self._entries.get(channel, ()):
             # get the amount of days ago the video was published & updated
-            published = datetime.fromisoformat(entry.published.text)
-            updated = datetime.fromisoformat(entry.updated.text)
+            published = datetime.fromisoformat(published)
+            updated = datetime.fromisoformat(updated)
             # Check if the video was posted less or equal to 2 days ago
             if (now - updated).days <= maxdaysago and (updated - published).days < 2 * maxdaysago:
                 # Check for the right words in the video title and then append them to the streams list
-                if any([self._findWholeWord(i)(entry.title.text) for i in self.keywords[channel]]):
+                if keywords(title):
                     # Do not append them if the title contains an ignore keyword
-                    if not (
-                        (ignore := self.ignore.get(channel)) and
-                        any([self._findWholeWord(i)(entry.title.text) for i in ignore])
-                    ):
-                        streams.append(entry.find('yt:videoId').string)
+                    if not (ignore and ignore(title)):
+                        streams.append(video_id)
         return streams
 
     async def request(self) -> dict[str, list[str]]:
@@ -145,11 +261,35 @@ class YouTubeRSS:
             Returns a dictionary containing lists of YouTube video IDs per
             channel and their YouTube channel ID as the value's key.
         """
-        # Get YouTube channels and their keywords
-        self._get_channel_list()
-        # Request upcoming streams for channels and store livestream links
-        streams = {}
-        for channel in self.channels:
-            streams[channel] = await self._get_channel_broadcastsRSS(channel)
+        # Get YouTube channels and their keywords, reloaded when changed
+        self.config = config = await self._config.load()
+        semaphore = asyncio.Semaphore(self.max_concurrent_feeds)
+
+        async def request_channel(channel: str) -> list[str]:
+            """
+            Request one channel, a slow or failing
+            feed returns no streams for this round.
+            """
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self._get_channel_broadcastsRSS(channel),
+                        self.feed_timeout
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f'YouTube channel {channel}: RSS feed '
+                        f'request failed: {e}, {type(e)}'
+                    )
+                    return []
+
+        # Forget the entries of removed channels
+        for channel in self._entries.keys() - set(config.channels):
+            del self._entries[channel]
+
+        # Request upcoming streams for channels concurrently
+        results = await asyncio.gather(
+            *[request_channel(channel) for channel in config.channels]
+        )
         # Returning
-        return streams
+        return dict(zip(config.channels, results))
@@ -1,4 +1,3 @@
-import aiohttp
 from discord import (
     app_commands,
     ChannelType,
@@ -112,16 +111,15 @@ class LiveLaunchCommand(commands.Cog):
                 if settings['notification_channel_id']:
 
                     # Create webhook for deletion
-                    async with aiohttp.ClientSession() as session:
-                        webhook = Webhook.from_url(
-                            settings['notification_webhook_url'],
-                            session=session
-                        )
-                        # Delete webhook
-                        try:
-                            await webhook.delete()
-                        except:
-                            pass
+                    webhook = Webhook.from_url(
+                        settings['notification_webhook_url'],
+                        session=self.bot.session()
+                    )
+                    # Delete webhook
+                    try:
+                        await webhook.delete()
+                    except:
+                        pass
 
                 # Add new data
                 notification_webhook_url = await create_webhook(
@@ -140,16 +138,15 @@ class LiveLaunchCommand(commands.Cog):
                 if settings['news_channel_id']:
 
                     # Create webhook for deletion
-                    async with aiohttp.ClientSession() as session:
-                        webhook = Webhook.from_url(
-                            settings['news_webhook_url'],
-                            session=session
-                        )
-                        # Delete webhook
-                        try:
-                            await webhook.delete()
-                        except:
-                            pass
+                    webhook = Webhook.from_url(
+                        settings['news_webhook_url'],
+                        session=self.bot.session()
+                    )
+                    # Delete webhook
+                    try:
+                        await webhook.delete()
+                    except:
+                        pass
 
                 # Add new data
                 news_webhook_url = await create_webhook(news, feature='News')
@@ -165,16 +162,15 @@ class LiveLaunchCommand(commands.Cog):
                 if settings['channel_id']:
 
                     # Create webhook for deletion
-                    async with aiohttp.ClientSession() as session:
-                        webhook = Webhook.from_url(
-                            settings['webhook_url'],
-                            session=session
-                        )
-                        # Delete webhook
-                        try:
-                            await webhook.delete()
-                        except:
-                            pass
+                    webhook = Webhook.from_url(
+                        settings['webhook_url'],
+                        session=self.bot.session()
+                    )
+                    # Delete webhook
+                    try:
+                        await webhook.delete()
+                    except:
+                        pass
 
                 # Add new data
                 webhook_url = await create_webhook(messages, feature='Messages')
@@ -310,16 +306,15 @@ class LiveLaunchCommand(commands.Cog):
         ):
             if features in (i, enums.Features.All) and settings[f'{key}webhook_url']:
                 # Create webhook for deletion
-                async with aiohttp.ClientSession() as session:
-                    webhook = Webhook.from_url(
-                        settings[f'{key}webhook_url'],
-                        session=session
-                    )
-                    # Delete webhook
-                    try:
-                        await webhook.delete()
-                    except:
-                        pass
+                webhook = Webhook.from_url(
+                    settings[f'{key}webhook_url'],
+                    session=self.bot.session()
+                )
+                # Delete webhook
+                try:
+                    await webhook.delete()
+                except:
+                    pass
 
                 new_settings[f'{key}channel_id'] = None
                 new_settings[f'{key}webhook_url'] = None
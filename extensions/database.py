@@ -1,4 +1,3 @@
-import aiohttp
 from discord import Webhook
 from discord.ext import commands, tasks
 import logging
@@ -26,16 +25,15 @@ class LiveLaunchDB(commands.Cog):
         async for guild_id, webhook_url in async_iter:
 
             # Create webhook connection for deletion
-            async with aiohttp.ClientSession() as session:
-                webhook = Webhook.from_url(
-                    webhook_url,
-                    session=session
-                )
-                # Delete webhook
-                try:
-                    await webhook.delete()
-                except:
-                    pass
+            webhook = Webhook.from_url(
+                webhook_url,
+                session=self.bot.session()
+            )
+            # Delete webhook
+            try:
+                await webhook.delete()
+            except:
+                pass
 
             # Update the guild settings
             await self.bot.lldb.enabled_guilds_edit(
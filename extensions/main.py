@@ -1,18 +1,22 @@
-import aiohttp
 from datetime import datetime, timedelta, timezone
 import discord
 from discord.ext import commands, tasks
 from discord.ui import Button, View
 from discord.utils import _bytes_to_base64_data
-from itertools import compress
+from itertools import chain, compress
 import logging
 from operator import itemgetter
 import re
 
 from bin import (
+    BoundedRunner,
     LaunchLibrary2 as ll2,
+    LL2Change,
+    LL2Changeset,
+    LL2Event,
     NASATV,
     NotificationCheck,
+    WebhookFanout,
     YouTubeAPI,
     YouTubeRSS,
     YouTubeStripVideoID
@@ -29,6 +33,22 @@ class LiveLaunch(commands.Cog):
         #### Settings ####
         # Scheduled event base url
         self.se_url = 'https://discord.com/events/%s/%s'
+        # Maximum amount of guilds to send stream messages to at once,
+        # limited by the connections to discord.com of the shared session
+        self.webhook_fanout = WebhookFanout(
+            concurrency=self.bot.session.limit_per_host
+        )
+        # LL2 event stages hold at most two database connections at once,
+        # an iterator's cursor and a nested edit, together they use at
+        # most half of the pool to leave room for the other loops
+        self.ll2_stage_connections = 2
+        self.ll2_runner = BoundedRunner(
+            concurrency=max(
+                self.bot.lldb.pool.maxsize // (2 * self.ll2_stage_connections),
+                1
+            ),
+            description='LL2 event update'
+        )
         # datetime accuracy
         self.timedelta_1m = timedelta(minutes=1)
         self.timedelta_1h = timedelta(hours=1)
@@ -49,6 +69,8 @@ class LiveLaunch(commands.Cog):
         self.ytid_re = YouTubeStripVideoID()
         # YouTube base url for videos
         self.yt_base_url = 'https://www.youtube.com/watch?v='
+        # Webhook name of streams whose channel can't be looked up
+        self.yt_fallback_name = 'YouTube'
         # Regex check for type checking
         self.type_check = re.compile('^[0-9]+$')
         # Itemgetter object for getting notification button settings
@@ -76,8 +98,9 @@ class LiveLaunch(commands.Cog):
             List containing dictionaries of the
             streams that need to be sent.
             - Mandatory keys:
-                - ` avatar ` : str
-                    Avatar URL.
+                - ` avatar ` : str or None
+                    Avatar URL, None for
+                    the webhook's default.
                 - ` channel ` : str
                     Channel name.
                 - ` yt_vid_id ` : str
@@ -88,41 +111,43 @@ class LiveLaunch(commands.Cog):
                 - ` embed ` : discord.Embed
                     Embed to send for
                     NASA TV streams.
-        """
-        async for guild_id, webhook_url in self.bot.lldb.enabled_guilds_webhook_iter():
-
-            # Fetch the agency filters set by the guild
-            filters = [
-                    await self.bot.lldb.ll2_agencies_filter_check(guild_id, i['agency_id'])
-                    if i['agency_id']
-                    else True
-                    for i in sending
-            ]
-
-            # Check if the filter is set to include or exclude the agencies
-            if await self.bot.lldb.ll2_agencies_filter_get_include_exclude(guild_id):
-                # Set to include, invert filters
-                filters = [not i for i in filters]
 
-            # Continue when everything is being filtered
-            if not any(filters):
-                continue
+        Notes
+        -----
+        Guilds are sent to concurrently
+        using the `.webhook_fanout` engine.
+        """
+        async def send(
+            guild_id: int,
+            webhook_url: str,
+            streams: list[dict[str, int | str]]
+        ) -> None:
+            """
+            Send the filtered streams to one guild.
 
+            Parameters
+            ----------
+            guild_id : int
+                Discord guild ID.
+            webhook_url : str
+                Discord webhook URL.
+            streams : list[dict[str, int | str]]
+                Streams to send to the guild.
+            """
             try:
-                # Creating session
-                async with aiohttp.ClientSession() as session:
-                    # Creating webhook
-                    webhook = discord.Webhook.from_url(
-                        webhook_url,
-                        session=session
-                    )
+                # Creating webhook
+                webhook = discord.Webhook.from_url(
+                    webhook_url,
+                    session=self.bot.session()
+                )
 
-                    # Sending streams
-                    for send in compress(sending, filters):
+                # Sending streams when the rate limits allow it
+                for stream in streams:
+                    async with self.bot.webhook_limiter(webhook_url):
                         await webhook.send(
-                            self.yt_base_url + send['yt_vid_id'],
-                            username=send['channel'],
-                            avatar_url=send['avatar']
+                            self.yt_base_url + stream['yt_vid_id'],
+                            username=stream['channel'],
+                            avatar_url=stream['avatar']
                         )
 
             # Remove channel and url from the db when either is removed or deleted
@@ -143,9 +168,25 @@ class LiveLaunch(commands.Cog):
                     f'video webhook sending: {e}, {type(e)}'
                 )
 
+        async def deliveries():
+            """
+            Yields a delivery coroutine per guild
+            with the streams it didn't filter.
+            """
+            # Guilds with the agency filters applied to the streams
+            agency_ids = [i['agency_id'] for i in sending]
+            async for guild_id, webhook_url, filters in (
+                self.bot.lldb.ll2_agencies_filter_eligible_iter(agency_ids)
+            ):
+                yield send(guild_id, webhook_url, list(compress(sending, filters)))
+
+        # Send to all guilds concurrently
+        await self.webhook_fanout(deliveries())
+
         # Sending complete, add streams to the database to prevent sending it again
-        for send in sending:
-            await self.bot.lldb.sent_media_add(yt_vid_id=send['yt_vid_id'])
+        await self.bot.lldb.sent_media_add_many(
+            yt_vid_ids=[i['yt_vid_id'] for i in sending]
+        )
 
     def create_scheduled_event(
         self,
@@ -313,7 +354,7 @@ class LiveLaunch(commands.Cog):
         self,
         ll2_id: str,
         *,
-        cached: dict[str, bool and datetime and int and str],
+        cached: LL2Event,
         check: dict[str, bool or datetime or int or str]
     ) -> None:
         """
@@ -324,9 +365,7 @@ class LiveLaunch(commands.Cog):
         ----------
         ll2_id : str
             Launch Library 2 ID.
-        cached: dict[
-            str, bool and datetime and int and str
-        ]
+        cached : LL2Event
             Cached data for the event.
         check : dict[
             str, bool or datetime or int or str
@@ -337,10 +376,7 @@ class LiveLaunch(commands.Cog):
 
         # Downloading image
         if (image_url := check.get('image_url')):
-            async with (
-                aiohttp.ClientSession() as session,
-                session.get(image_url) as resp
-            ):
+            async with self.bot.session().get(image_url) as resp:
                 # Check status and size (Discord maximum)
                 if resp.status == 200 and resp.content_length <= 10240000:
                     check['image'] = await resp.read()
@@ -372,7 +408,7 @@ class LiveLaunch(commands.Cog):
                 now = datetime.now(timezone.utc) + self.timedelta_1m
 
                 # Ignore `webcast_live` when it becomes True when the event is already live
-                if check.get('webcast_live') and cached['start'] < now:
+                if check.get('webcast_live') and cached.start < now:
                     del modify['webcast_live']
 
                 if (start := check.get('start')):
@@ -382,13 +418,13 @@ class LiveLaunch(commands.Cog):
                         # Remove `start` value from the modify dict, can't update
                         del modify['start']
                         # Start event if it hasn't yet
-                        if cached['start'] > now:
+                        if cached.start > now:
                             modify['webcast_live'] = True
 
                     # If `start` moved forward while the event is live
-                    elif cached['webcast_live'] or cached['start'] < now:
+                    elif cached.webcast_live or cached.start < now:
                         # If there's no webcast and start moved more than 1 hour into the future
-                        if not cached['webcast_live'] and start > now + self.timedelta_1h:
+                        if not cached.webcast_live and start > now + self.timedelta_1h:
 
                             try:
                                 # Remove the scheduled event from Discord
@@ -521,12 +557,166 @@ class LiveLaunch(commands.Cog):
         # Return overall success status
         return status
 
+    def scheduled_event_relevant(self, event: LL2Event) -> bool:
+        """
+        Check whether an LL2 event should
+        have Discord scheduled events.
+
+        Parameters
+        ----------
+        event : LL2Event
+            Upcoming LL2 event.
+
+        Returns
+        -------
+        relevant : bool
+            Whether the event hasn't ended yet.
+        """
+        return event.end > datetime.now(timezone.utc) \
+            and event.status not in self.ll2.launch_status_end
+
+    async def ll2_event_changed(self, change: LL2Change) -> None:
+        """
+        Store the changes of a cached LL2 event, sends
+        its notifications and updates its scheduled events.
+
+        Parameters
+        ----------
+        change : LL2Change
+            Cached and new data of the event.
+        """
+        cached, data = change.cached, change.new
+        ll2_id = data.ll2_id
+        check = dict(change.fields)
+
+        # Update agency data
+        if (agency_id := check.get('agency_id')):
+            # Update agencies table
+            await self.bot.lldb.ll2_agencies_replace(
+                agency_id,
+                data.agency_name
+            )
+            # Update events table
+            await self.bot.lldb.ll2_events_edit(
+                ll2_id,
+                agency_id=agency_id
+            )
+            # Done
+            check.pop('agency_id')
+
+        # Update flightclub boolean
+        if (flightclub := check.get('flightclub')):
+            # Update events table
+            await self.bot.lldb.ll2_events_edit(
+                ll2_id,
+                flightclub=flightclub
+            )
+            # Done
+            check.pop('flightclub')
+
+        # Get current and possible new status
+        old_status, new_status = change.status or (cached.status,) * 2
+        # Get current and possible new start time
+        cached_start, new_start = change.start or (cached.start, None)
+        # Get the notifications types for these statuses
+        notification_type = self.notification_check(
+            old_status=old_status,
+            new_status=new_status,
+            old_start=cached_start,
+            new_start=new_start
+        )
+
+        # Check for notifications
+        if notification_type is not None:
+            # Status only or both (0, 2)
+            if notification_type != 1:
+                # Update events table
+                await self.bot.lldb.ll2_events_edit(
+                    ll2_id,
+                    status=new_status
+                )
+                # Done
+                check.pop('status')
+
+            # Send notifications
+            await self.send_notification(
+                notification_type,
+                ll2_id=ll2_id,
+                data=data,
+                cached_start=cached_start
+            )
+
+        # Check for scheduled event relevance
+        if self.scheduled_event_relevant(data):
+            # If there are any more updates, update the scheduled events
+            if check:
+                await self.scheduled_events_update(
+                    ll2_id,
+                    cached=cached,
+                    check=check
+                )
+        # Removal of existing scheduled events
+        else:
+            await self.scheduled_events_remove(ll2_id)
+            # Update cache if needed
+            if check:
+                await self.bot.lldb.ll2_events_edit(
+                    ll2_id,
+                    **check
+                )
+
+    async def ll2_event_unchanged(self, event: LL2Event) -> None:
+        """
+        Remove the scheduled events of
+        an unchanged LL2 event once it ended.
+
+        Parameters
+        ----------
+        event : LL2Event
+            Upcoming LL2 event.
+        """
+        if not self.scheduled_event_relevant(event):
+            await self.scheduled_events_remove(event.ll2_id)
+
+    async def ll2_event_removed(self, event: LL2Event) -> None:
+        """
+        Remove a cached LL2 event that
+        is no longer upcoming.
+
+        Parameters
+        ----------
+        event : LL2Event
+            Cached LL2 event.
+        """
+        # Remove Discord events
+        if await self.scheduled_events_remove(event.ll2_id):
+            # Remove from the database
+            await self.bot.lldb.ll2_events_remove(event.ll2_id)
+
+    async def ll2_event_added(self, event: LL2Event) -> None:
+        """
+        Add a new upcoming LL2 event to the database.
+
+        Parameters
+        ----------
+        event : LL2Event
+            Upcoming LL2 event.
+        """
+        # Update agency if needed
+        if event.agency_id:
+            await self.bot.lldb.ll2_agencies_replace(
+                event.agency_id,
+                name=event.agency_name
+            )
+        # Add event
+        await self.bot.lldb.ll2_events_add(event)
+
     async def send_notification(
         self,
         notification_type : int,
         *,
         ll2_id: str,
-        data: dict[str, bool and datetime and int and str],
+        data: LL2Event,
         cached_start: datetime = None
     ) -> None:
         """
@@ -590,16 +780,15 @@ class LiveLaunch(commands.Cog):
                         message['view'].add_item(i)
 
                 try:
-                    # Creating session
-                    async with aiohttp.ClientSession() as session:
-                        # Creating webhook with the client to be able to send buttons
-                        webhook = discord.Webhook.from_url(
-                            notification['notification_webhook_url'],
-                            client=self.bot,
-                            session=session
-                        )
+                    # Creating webhook with the client to be able to send buttons
+                    webhook = discord.Webhook.from_url(
+                        notification['notification_webhook_url'],
+                        client=self.bot,
+                        session=self.bot.session()
+                    )
 
-                        # Sending notification
+                    # Sending notification when the rate limits allow it
+                    async with self.bot.webhook_limiter(notification['notification_webhook_url']):
                         await webhook.send(
                             **message,
                             embed=embed,
@@ -627,10 +816,10 @@ class LiveLaunch(commands.Cog):
 
         # Kwargs dict and get status
         kwargs = {'ll2_id': ll2_id}
-        status = data.get('status')
+        status = data.status
 
         # Only enable video URL when available
-        if (url := data['url']):
+        if (url := data.url):
             title_url = {'url': url}
             url = f'[Stream]({url})'
         else:
@@ -655,7 +844,7 @@ class LiveLaunch(commands.Cog):
                 label=ll2.sln_name,
                 style=discord.ButtonStyle.link,
                 emoji=ll2.sln_emoji,
-                url=sln_url % data['slug']
+                url=sln_url % data.slug
             )
         )
         # Add G4L button
@@ -686,14 +875,14 @@ class LiveLaunch(commands.Cog):
         # Creating embed
         embed = discord.Embed(
             color=ll2.status_colours.get(status, 0xFFFF00),
-            timestamp=data['start'],
-            title=data['name'],
+            timestamp=data.start,
+            title=data.name,
             **title_url
         )
         # Set thumbnail
-        if data['image_url']:
+        if data.image_url:
             embed.set_thumbnail(
-                url=data['image_url']
+                url=data.image_url
             )
         # Set footer
         embed.set_footer(
@@ -720,7 +909,7 @@ class LiveLaunch(commands.Cog):
             t0_embed = embed.copy() if notification_type == 2 else embed
             # Set description
             t0_embed.description = f'**T-0** changed from <t:{int(cached_start.timestamp())}:F>' \
-                f" to <t:{int(data['start'].timestamp())}:F>\n" + \
+                f" to <t:{int(data.start.timestamp())}:F>\n" + \
                 (f'**Status:** {ll2.status_names[status]}\n{url}' if status else url)
 
             # Send notifications
@@ -731,7 +920,7 @@ class LiveLaunch(commands.Cog):
         if notification_type == 2:
             # Set description
             embed.description = f'**T-0** changed from <t:{int(cached_start.timestamp())}:F>' \
-                f" to <t:{int(data['start'].timestamp())}:F>\n" + \
+                f" to <t:{int(data.start.timestamp())}:F>\n" + \
                 (f'**New status:** {ll2.status_names[status]}\n{url}' if status else url)
 
             # Send to servers with both T-0 and status change
@@ -762,163 +951,75 @@ class LiveLaunch(commands.Cog):
         -----
         Makes or updates Discord scheduled events and
         sends webhook messages of the livestream URL.
+        The loop runs faster when events are close to
+        T-0, see `LaunchLibrary2.poll_interval()`.
         """
         # Get upcoming launches and events from the LL2 API
         upcoming = await self.ll2.upcoming()
 
+        # Adapt the time until the next iteration
+        self.check_ll2.change_interval(
+            seconds=self.ll2.poll_interval(upcoming)
+        )
+
         # No data, return
         if not upcoming:
             logger.info('No LL2 Data')
             return
 
         #### Discord scheduled events & notifications ####
-        # Iterate over the cached LL2 events
-        cached_ll2_events = []
-        async for cached in self.bot.lldb.ll2_events_iter():
-            ll2_id = cached['ll2_id']
-            cached_ll2_events.append(ll2_id)
-
-            ## Update LL2 event data ##
-
-            # Check if the event still exists
-            if data := upcoming.get(ll2_id):
-
-                # Now datetime for checks
-                now = datetime.now(timezone.utc)
-
-                # Scheduled event check
-                scheduled_event_check = data['end'] > now \
-                    and data.get('status') not in self.ll2.launch_status_end
-
-                # Check for updates to the event
-                check = {key: data.get(key) for key in self.ll2.data_keys if data.get(key) != cached[key]}
-
-                # Update agency data
-                if (agency_id := check.get('agency_id')):
-                    # Update agencies table
-                    await self.bot.lldb.ll2_agencies_replace(
-                        agency_id,
-                        data['agency_name']
-                    )
-                    # Update events table
-                    await self.bot.lldb.ll2_events_edit(
-                        ll2_id,
-                        agency_id=agency_id
-                    )
-                    # Done
-                    check.pop('agency_id')
-
-                # Update flightclub boolean
-                if (flightclub := check.get('flightclub')):
-                    # Update events table
-                    await self.bot.lldb.ll2_events_edit(
-                        ll2_id,
-                        flightclub=flightclub
-                    )
-                    # Done
-                    check.pop('flightclub')
-
-                # Get current and possible new status
-                old_status = cached.get('status')
-                new_status = check.get('status', old_status)
-                # Get current start time
-                cached_start = cached['start']
-                # Get the notifications types for these statuses
-                notification_type = self.notification_check(
-                    old_status=old_status,
-                    new_status=new_status,
-                    old_start=cached_start,
-                    new_start=check.get('start')
-                )
-
-                # Check for notifications
-                if notification_type is not None:
-                    # Status only or both (0, 2)
-                    if notification_type != 1:
-                        # Update events table
-                        await self.bot.lldb.ll2_events_edit(
-                            ll2_id,
-                            status=new_status
-                        )
-                        # Done
-                        check.pop('status')
-
-                    # Send notifications
-                    await self.send_notification(
-                        notification_type,
-                        ll2_id=ll2_id,
-                        data=data,
-                        cached_start=cached_start
-                    )
-
-                # Check for scheduled event relevance
-                if scheduled_event_check:
-                    # If there are any more updates, update the scheduled events
-                    if check:
-                        await self.scheduled_events_update(
-                            ll2_id,
-                            cached=cached,
-                            check=check
-                        )
-                # Removal of existing scheduled events
-                else:
-                    await self.scheduled_events_remove(ll2_id)
-                    # Update cache if needed
-                    if check:
-                        await self.bot.lldb.ll2_events_edit(
-                            ll2_id,
-                            **check
-                        )
+        # Compare the cached LL2 events with the upcoming ones
+        changeset = LL2Changeset.from_snapshots(
+            {
+                cached.ll2_id: cached
+                async for cached in self.bot.lldb.ll2_events_iter()
+            },
+            upcoming
+        )
 
-            # Cached event no longer exists
-            else:
-                # Remove Discord events
-                if await self.scheduled_events_remove(ll2_id):
-                    # Remove from the database
-                    await self.bot.lldb.ll2_events_remove(ll2_id)
+        # Apply the changes of every event concurrently, see `.ll2_runner`
+        await self.ll2_runner(
+            chain(
+                map(self.ll2_event_changed, changeset.changed),
+                map(self.ll2_event_unchanged, changeset.unchanged),
+                map(self.ll2_event_removed, changeset.removed),
+                map(self.ll2_event_added, changeset.added)
+            )
+        )
 
         ## Creation of new scheduled events ##
 
-        # New events, not cached yet
-        new_ll2_events = upcoming.keys() - cached_ll2_events
-
-        # Add new events to the database
-        for ll2_id in new_ll2_events:
-            # Update agency if needed
-            if (agency_id := upcoming[ll2_id].get('agency_id')):
-                await self.bot.lldb.ll2_agencies_replace(
-                    agency_id,
-                    name=upcoming[ll2_id]['agency_name']
-                )
-            # Add event
-            await self.bot.lldb.ll2_events_add(
-                ll2_id,
-                **upcoming[ll2_id]
-            )
+        # Downloaded images per LL2 ID
+        images = {}
 
         # Asking the database for Guilds that need new events
         async for row in self.bot.lldb.scheduled_events_remove_create_iter():
 
             # Create wanted Launch Library 2 as Discord scheduled events
             if row['create_remove']:
+                event = upcoming[row['ll2_id']]
 
                 # Downloading image
-                if (upcoming[row['ll2_id']].get('image') is None
-                        and (image_url := upcoming[row['ll2_id']].get('image_url'))):
-                    async with (
-                        aiohttp.ClientSession() as session,
-                        session.get(image_url) as resp
-                    ):
-                        # Check status and size (Discord maximum)
-                        if resp.status == 200 and resp.content_length <= 10240000:
-                            upcoming[row['ll2_id']]['image'] = await resp.read()
+                if event.ll2_id not in images:
+                    images[event.ll2_id] = None
+                    if event.image_url:
+                        async with self.bot.session().get(event.image_url) as resp:
+                            # Check status and size (Discord maximum)
+                            if resp.status == 200 and resp.content_length <= 10240000:
+                                images[event.ll2_id] = await resp.read()
 
                 reset_settings = False
                 try:
                     # Create Discord scheduled event
                     new_event = await self.create_scheduled_event(
                         row['guild_id'],
-                        **upcoming[row['ll2_id']]
+                        event.name,
+                        event.description,
+                        event.url,
+                        event.start,
+                        event.end,
+                        webcast_live=event.webcast_live,
+                        image=images[event.ll2_id]
                     )
                 except (discord.errors.Forbidden, discord.errors.NotFound):
                     # When missing access or already removed event
@@ -976,33 +1077,52 @@ class LiveLaunch(commands.Cog):
         #### Sending streams using webhooks ####
 
         # Go through upcoming streams for webhook sending
-        sending = []
+        candidates = {}
         for ll2_id, data in upcoming.items():
             # Add stream if it is within 1 hour to the sending list
             now = datetime.now(timezone.utc)
-            if abs(data['start'] - now) < timedelta(hours=1) and data['url']:
+            if abs(data.start - now) < timedelta(hours=1) and data.url:
                 # Check if the stream is on YouTube and not a NASA TV stream
-                yt_vid_id = self.ytid_re(data['url'])
+                yt_vid_id = self.ytid_re(data.url)
                 if yt_vid_id and self.yt_base_url + (yt_vid_id := yt_vid_id[0]) not in self.nasatv:
-                    # Only send streams that aren't sent already
-                    if not await self.bot.lldb.sent_media_exists(yt_vid_id=yt_vid_id):
+                    candidates[yt_vid_id] = data
+
+        # Only send streams that aren't sent already
+        if candidates:
+            candidates = {
+                yt_vid_id: candidates[yt_vid_id]
+                for yt_vid_id in await self.bot.lldb.sent_media_unseen(
+                    yt_vid_ids=list(candidates)
+                )
+            }
 
-                        # Get YouTube channel
-                        if (channel := self.ytapi.get_channel_from_video(yt_vid_id)) is None:
-                            # Can't find the channel, continue
-                            continue
-                        # Get YouTube channel name and avatar
-                        thumb, title = self.ytapi.get_channel_thumbtitle(channel)
-
-                        # Adding to the sending list
-                        sending.append(
-                            {
-                                'avatar': thumb,
-                                'channel': title,
-                                'yt_vid_id': yt_vid_id,
-                                'agency_id': data.get('agency_id')
-                            }
-                        )
+        # Get the YouTube channels, their names and avatars all at once
+        sending = []
+        if candidates:
+            channels, deferred = await self.ytapi.get_channels_from_videos(
+                list(candidates)
+            )
+            thumbtitles = await self.ytapi.get_channels_thumbtitle(list(channels.values()))
+
+            for yt_vid_id, data in candidates.items():
+                # Can't find the video, continue unless the lookup is deferred
+                if yt_vid_id not in channels and yt_vid_id not in deferred:
+                    continue
+                # Without the channel, fall back to the agency name
+                thumb, title = thumbtitles.get(
+                    channels.get(yt_vid_id),
+                    (None, data.agency_name or self.yt_fallback_name)
+                )
+
+                # Adding to the sending list
+                sending.append(
+                    {
+                        'avatar': thumb,
+                        'channel': title,
+                        'yt_vid_id': yt_vid_id,
+                        'agency_id': data.agency_id
+                    }
+                )
 
         if sending:
             # Send streams
@@ -1017,33 +1137,48 @@ class LiveLaunch(commands.Cog):
         """
         Discord task for checking the YouTube RSS feed.
         """
-        # Storage list of streams to send
-        sending = []
-
         # Check if there are any streams
         streams = await self.ytrss.request()
 
         # Iterate over dictionary to see which streams needs to be sent
+        candidates = {}
         for channel in streams:
-            # Check if the channel has any streams
-            if streams[channel]:
-                # Iterate through the streams of a channel
-                for yt_vid_id in streams[channel]:
-                    # Only send streams that aren't sent already
-                    if not await self.bot.lldb.sent_media_exists(yt_vid_id=yt_vid_id):
-
-                        # Get YouTube channel name and avatar
-                        thumb, title = self.ytapi.get_channel_thumbtitle(channel)
-
-                        # Adding to the sending list
-                        sending.append(
-                            {
-                                'avatar': thumb,
-                                'channel': title,
-                                'yt_vid_id': yt_vid_id,
-                                'agency_id': self.ytrss.agency_ids.get(channel)
-                            }
-                        )
+            # Iterate through the streams of a channel
+            for yt_vid_id in streams[channel]:
+                candidates[yt_vid_id] = channel
+
+        # Only send streams that aren't sent already
+        if candidates:
+            candidates = {
+                yt_vid_id: candidates[yt_vid_id]
+                for yt_vid_id in await self.bot.lldb.sent_media_unseen(
+                    yt_vid_ids=list(candidates)
+                )
+            }
+
+        # Get the YouTube channel names and avatars all at once
+        sending = []
+        if candidates:
+            thumbtitles = await self.ytapi.get_channels_thumbtitle(
+                list(candidates.values())
+            )
+
+            for yt_vid_id, channel in candidates.items():
+                # Can't find the channel, fall back to a generic name
+                thumb, title = thumbtitles.get(
+                    channel,
+                    (None, self.yt_fallback_name)
+                )
+
+                # Adding to the sending list
+                sending.append(
+                    {
+                        'avatar': thumb,
+                        'channel': title,
+                        'yt_vid_id': yt_vid_id,
+                        'agency_id': self.ytrss.config.agency_ids.get(channel)
+                    }
+                )
 
         if sending:
             # Send streams
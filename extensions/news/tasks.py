@@ -1,10 +1,9 @@
-import aiohttp
 import discord
 from discord.ext import commands, tasks
 from itertools import compress
 import logging
 
-from bin import SpaceflightNewsAPI
+from bin import combine_embeds, SpaceflightNewsAPI
 
 logger = logging.getLogger(__name__)
 
@@ -28,15 +27,20 @@ class LiveLaunchNewsTasks(commands.Cog):
         # Get news articles
         news = await self.snapi()
 
-        # Check if article is already sent, then generate embeds
-        new_news = []
-        for article in news:
-            if await self.bot.lldb.sent_media_exists(snapi_id=article['id']):
-                continue
+        # Only continue with articles that aren't sent already
+        unseen = set(
+            await self.bot.lldb.sent_media_unseen(
+                snapi_ids=[i['id'] for i in news]
+            )
+        )
+        news = [i for i in news if i['id'] in unseen]
 
-            # Add `snapi_id` to the db to prevent resending
-            await self.bot.lldb.sent_media_add(snapi_id=article['id'])
+        # Add `snapi_id`s to the db to prevent resending
+        await self.bot.lldb.sent_media_add_many(snapi_ids=list(unseen))
 
+        # Generate embeds
+        new_news = []
+        for article in news:
             # Add the news site to the db if needed
             await self.bot.lldb.news_sites_add(article['news_site'])
 
@@ -69,40 +73,34 @@ class LiveLaunchNewsTasks(commands.Cog):
         if not new_news:
             return
 
-        # Sending
-        async for guild_id, webhook_url in self.bot.lldb.enabled_guilds_news_iter():
-
-            # Fetch the news site filters set by the guild
-            filters = [
-                await self.bot.lldb.news_filter_check(guild_id, i['news_site'])
-                for i in new_news
-            ]
-
-            # Check if the filter is set to include or exclude the news sites
-            if await self.bot.lldb.news_filter_get_include_exclude(guild_id):
-                # Set to include, invert filters
-                filters = [not i for i in filters]
-
-            # Continue when everything is being filtered
-            if not any(filters):
-                continue
+        # Sending to guilds with the news site filters applied to the articles
+        news_site_names = [i['news_site'] for i in new_news]
+        async for guild_id, webhook_url, filters in (
+            self.bot.lldb.news_filter_eligible_iter(news_site_names)
+        ):
 
             try:
-                # Creating session
-                async with aiohttp.ClientSession() as session:
-                    # Creating webhook
-                    webhook = discord.Webhook.from_url(
-                        webhook_url,
-                        session=session
-                    )
-
-                    # Sending filtered articles
-                    for article in compress(new_news, filters):
-                        await webhook.send(
-                            embed=article['embed'],
-                            username=article['news_site'],
-                            avatar_url=article['logo_url']
-                        )
+                # Creating webhook
+                webhook = discord.Webhook.from_url(
+                    webhook_url,
+                    session=self.bot.session()
+                )
+
+                # Group the filtered articles per news site
+                news_sites = {}
+                for article in compress(new_news, filters):
+                    news_sites.setdefault(article['news_site'], []).append(article)
+
+                # Sending the articles of a news site in as few messages
+                # as possible when the rate limits allow it
+                for articles in news_sites.values():
+                    for embeds in combine_embeds([i['embed'] for i in articles]):
+                        async with self.bot.webhook_limiter(webhook_url):
+                            await webhook.send(
+                                embeds=embeds,
+                                username=articles[0]['news_site'],
+                                avatar_url=articles[0]['logo_url']
+                            )
 
             # Remove channel and url from the db when either is removed or deleted
             except discord.errors.NotFound:
@@ -1,4 +1,3 @@
-from datetime import datetime
 import discord
 from discord import app_commands, Interaction
 from discord.app_commands import AppCommandError, Range
@@ -7,7 +6,7 @@ from discord.ui import Button, View
 import logging
 import re
 
-from bin import LaunchLibrary2 as ll2
+from bin import LaunchLibrary2 as ll2, LL2Event
 
 logger = logging.getLogger(__name__)
 
@@ -96,7 +95,7 @@ class LiveLaunchNext(commands.Cog):
 
     def create_single_embed(
         self,
-        item: dict[str, bool and datetime and int and str]
+        item: LL2Event
     ) -> discord.Embed:
         """
         Create the embed with
@@ -104,7 +103,7 @@ class LiveLaunchNext(commands.Cog):
 
         Parameters
         ----------
-        item : dict[str, bool and datetime and int and str]
+        item : LL2Event
             Item for in the message.
 
         Returns
@@ -112,10 +111,10 @@ class LiveLaunchNext(commands.Cog):
         embed : discord.Embed
             Created embed.
         """
-        status = item.get('status')
+        status = item.status
 
         # Only enable video URL when available
-        if (url := item['url']):
+        if (url := item.url):
             title_url = {'url': url}
             url = f'[Stream]({url})'
         else:
@@ -125,16 +124,16 @@ class LiveLaunchNext(commands.Cog):
         # Creating embed
         embed = discord.Embed(
             color=ll2.status_colours.get(status, 0xFFFF00),
-            description=f"<t:{int(item['start'].timestamp())}:F>\n"
-                f"{item['location']}\n{url}",
-            timestamp=item['start'],
-            title=item['name'],
+            description=f"<t:{int(item.start.timestamp())}:F>\n"
+                f"{item.location}\n{url}",
+            timestamp=item.start,
+            title=item.name,
             **title_url
         )
         # Set thumbnail
-        if item['image_url']:
+        if item.image_url:
             embed.set_thumbnail(
-                url=item['image_url']
+                url=item.image_url
             )
         # Set footer
         embed.set_footer(
@@ -145,7 +144,7 @@ class LiveLaunchNext(commands.Cog):
 
     def create_multi_embed(
         self,
-        items: dict[str, dict[str, bool and datetime and int and str]],
+        items: dict[str, LL2Event],
         events: bool = False,
         launches: bool = False
     ) -> discord.Embed:
@@ -155,7 +154,7 @@ class LiveLaunchNext(commands.Cog):
 
         Parameters
         ----------
-        items : dict[str, dict[str, bool and datetime and int and str]]
+        items : dict[str, LL2Event]
             Items for in the message.
         events : bool, default: False
             Select events only.
@@ -186,19 +185,19 @@ class LiveLaunchNext(commands.Cog):
         # Add fields
         for item in items.values():
             # Get status
-            status = item.get('status')
+            status = item.status
 
             # Only enable video URL when available
-            if (url := item['url']):
+            if (url := item.url):
                 url = f'[Stream]({url})'
             else:
                 url = ll2.no_stream
 
             # Add field
             embed.add_field(
-                name=item['name'],
-                value=f"<t:{int(item['start'].timestamp())}:F>\n"
-                    f"{item['location']}\n{url}",
+                name=item.name,
+                value=f"<t:{int(item.start.timestamp())}:F>\n"
+                    f"{item.location}\n{url}",
                 inline=False
             )
 
@@ -285,13 +284,13 @@ class LiveLaunchNext(commands.Cog):
             # Fallback default button settings
             if button_settings is None:
                 button_settings = {
-                    'button_fc': items[ll2_id]['flightclub'],
+                    'button_fc': items[ll2_id].flightclub,
                     'button_g4l': True,
                     'button_sln': True
                 }
 
             # Create buttons
-            if (buttons := await self.create_buttons(button_settings, ll2_id, items[ll2_id]['slug'])):
+            if (buttons := await self.create_buttons(button_settings, ll2_id, items[ll2_id].slug)):
                 message['view'] = buttons
 
         # Amount > 1
@@ -1,4 +1,3 @@
-import aiohttp
 import discord
 from discord.ext import commands, tasks
 from discord.ui import Button, View
@@ -117,16 +116,15 @@ class LiveLaunchNotificationsTasks(commands.Cog):
                 )
 
             try:
-                # Creating session
-                async with aiohttp.ClientSession() as session:
-                    # Creating webhook with the client to be able to send buttons
-                    webhook = discord.Webhook.from_url(
-                        notification['notification_webhook_url'],
-                        client=self.bot,
-                        session=session
-                    )
+                # Creating webhook with the client to be able to send buttons
+                webhook = discord.Webhook.from_url(
+                    notification['notification_webhook_url'],
+                    client=self.bot,
+                    session=self.bot.session()
+                )
 
-                    # Sending notification
+                # Sending notification when the rate limits allow it
+                async with self.bot.webhook_limiter(notification['notification_webhook_url']):
                     await webhook.send(
                         **message,
                         username=notification['agency'],
@@ -7,7 +7,7 @@ from os import getenv
 from pathlib import Path
 import warnings
 
-from bin import Database
+from bin import Database, shared_session, WebhookRateLimiter
 
 logging.basicConfig(
     filename='livelaunch.log',
@@ -46,6 +46,11 @@ class LiveLaunchBot(Bot):
         )
         # Database object
         self.lldb = Database()
+        # Shared aiohttp session for all outbound HTTP requests
+        self.session = shared_session
+        # Webhook rate limit scheduler reading the shared session's responses
+        self.webhook_limiter = WebhookRateLimiter()
+        self.session.trace_configs.append(self.webhook_limiter.trace_config)
         # Extensions to load with database first as others depend on it
         self.initial_extensions  = [
             'extensions.database',
@@ -58,7 +63,8 @@ class LiveLaunchBot(Bot):
 
     def run(self, token: str) -> None:
         """
-        Connect to the database and start the bot.
+        Connect to the database and start the bot,
+        the shared HTTP session is closed on exit.
 
         Parameters
         ----------
@@ -66,7 +72,7 @@ class LiveLaunchBot(Bot):
             The authentication token.
         """
         async def runner() -> None:
-            async with self.lldb, self:
+            async with self.lldb, self.session, self:
                 await self.lldb.start()
                 await self.start(token, reconnect=True)
 
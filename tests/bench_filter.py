@@ -0,0 +1,94 @@
+"""
+Compare the per-guild agency filter queries with
+`filter_eligible_iter`, run with `python -m tests.bench_filter`.
+
+Only SELECT queries are used, the database of
+`Database` is used unless `BENCH_DB_HOST`,
+`BENCH_DB_USER` or `BENCH_DB_NAME` are set,
+the password is read from `DB_PWD`.
+"""
+import asyncio
+from os import getenv
+from time import perf_counter
+
+import aiomysql
+from dotenv import load_dotenv
+
+from bin import Database
+
+async def per_guild(db: Database, agency_ids: list[int | None]) -> list:
+    """
+    Agency filters of every guild using the
+    previous queries per guild and agency.
+    """
+    result = []
+    async for guild_id, webhook_url in db.enabled_guilds_webhook_iter():
+        filters = [
+            await db.ll2_agencies_filter_check(guild_id, i) if i else True
+            for i in agency_ids
+        ]
+        if await db.ll2_agencies_filter_get_include_exclude(guild_id):
+            filters = [not i for i in filters]
+        if any(filters):
+            result.append((guild_id, webhook_url, filters))
+    return result
+
+async def eligible(db: Database, agency_ids: list[int | None]) -> list:
+    """
+    Agency filters of every guild using `filter_eligible_iter`.
+    """
+    return [
+        row async for row in db.ll2_agencies_filter_eligible_iter(agency_ids)
+    ]
+
+async def timed(run, *args, repeat: int = 5) -> tuple[float, list]:
+    """
+    Best time in milliseconds of `repeat` runs and the result.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        result = await run(*args)
+        best = min(best, perf_counter() - start)
+    return best * 1000, result
+
+async def main(streams: int = 8) -> None:
+    load_dotenv()
+    db = Database()
+    db.pool = await aiomysql.create_pool(
+        host=getenv('BENCH_DB_HOST', db._host),
+        user=getenv('BENCH_DB_USER', db._user),
+        password=getenv('DB_PWD'),
+        db=getenv('BENCH_DB_NAME', db._database),
+        autocommit=True
+    )
+    try:
+        async with db.pool.acquire() as con, con.cursor() as cur:
+            await cur.execute(
+                'SELECT agency_id FROM ll2_agencies ORDER BY agency_id LIMIT %s',
+                (streams - 1,)
+            )
+            # Streams of agencies and one without an agency
+            agency_ids = [row[0] for row in await cur.fetchall()] + [None]
+            await cur.execute(
+                'SELECT COUNT(*) FROM enabled_guilds WHERE webhook_url IS NOT NULL'
+            )
+            guilds = (await cur.fetchone())[0]
+        print(f'{guilds} guilds, {len(agency_ids)} streams')
+
+        baseline, expected = await timed(per_guild, db, agency_ids)
+        print(f'{"per guild":>16}: {baseline:.1f} ms')
+        for name, ttl in (('bitmask query', 0), ('filter cache', 600)):
+            db._filter_cache_ttl = ttl
+            db.filter_cache_clear()
+            elapsed, result = await timed(eligible, db, agency_ids)
+            # Every path has to return the same guilds and filters
+            assert sorted(result) == sorted(expected), name
+            print(f'{name:>16}: {elapsed:.1f} ms, {baseline / elapsed:.1f}x')
+    finally:
+        db.pool.close()
+        await db.pool.wait_closed()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,34 @@
+"""
+Compare `YouTubeRSS._parseRSS` with the previous BeautifulSoup
+parser on the feed fixture, run with `python -m tests.bench_youtube_rss`.
+"""
+from timeit import repeat
+
+from bin import YouTubeRSS
+from tests.test_youtube_rss import FIXTURE, parse_bs4
+
+def main(number: int = 200) -> None:
+    feed = FIXTURE.read_bytes()
+    rss = YouTubeRSS()
+    parsers = {
+        'BeautifulSoup': lambda: parse_bs4(feed),
+        'lxml iterparse': lambda: list(rss._parseRSS(feed))
+    }
+
+    # Both parsers have to return the same entries
+    results = {name: parse() for name, parse in parsers.items()}
+    assert results['BeautifulSoup'] == results['lxml iterparse']
+
+    timings = {}
+    for name, parse in parsers.items():
+        # Best of 5 runs, in milliseconds per feed
+        timings[name] = min(repeat(parse, number=number, repeat=5)) / number * 1000
+        print(f'{name:>15}: {timings[name]:.3f} ms per feed')
+    print(
+        f"{'speedup':>15}: "
+        f"{timings['BeautifulSoup'] / timings['lxml iterparse']:.1f}x"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+class FakeCursor:
+    """
+    Stand-in of an aiomysql cursor, results
+    come from the `respond` callable.
+    """
+    def __init__(self, pool: 'FakePool') -> None:
+        self._pool = pool
+        self._rows = []
+        self.rowcount = 0
+
+    async def execute(self, query: str, args: Any = None) -> None:
+        self._pool.queries.append((query, args))
+        self._rows = list(self._pool.respond(query, args) or ())
+        self.rowcount = len(self._rows)
+
+    async def fetchall(self) -> list[tuple]:
+        return self._rows
+
+    async def fetchone(self) -> tuple | None:
+        return self._rows[0] if self._rows else None
+
+    async def __aiter__(self):
+        for row in self._rows:
+            yield row
+
+
+class FakeConnection:
+    def __init__(self, pool: 'FakePool') -> None:
+        self._pool = pool
+
+    @asynccontextmanager
+    async def cursor(self):
+        yield FakeCursor(self._pool)
+
+
+class FakePool:
+    """
+    Stand-in of an aiomysql pool recording
+    the executed queries in `.queries`.
+    """
+    def __init__(self, respond: Callable[[str, Any], list[tuple] | None]) -> None:
+        self.respond = respond
+        self.queries: list[tuple[str, Any]] = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield FakeConnection(self)
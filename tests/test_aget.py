@@ -0,0 +1,39 @@
+import unittest
+from unittest import mock
+
+from bin import get, NOT_MODIFIED, SharedSession
+
+class TestConditionalGet(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests of the validators of conditional `get` requests.
+    """
+    def setUp(self):
+        self.session = SharedSession(validators_size=2)
+        patcher = mock.patch('bin.aget.shared_session', self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def request(self, url: str, status: int = 200) -> str:
+        response = mock.MagicMock(status=status, headers={'ETag': f'"{url}"'})
+        response.text = mock.AsyncMock(return_value=url)
+        client = mock.MagicMock()
+        client.get.return_value.__aenter__.return_value = response
+        with mock.patch.object(SharedSession, '__call__', return_value=client):
+            result = await get(url, conditional=True)
+        self.headers = client.get.call_args.kwargs['headers']
+        return result
+
+    async def test_validators_sent(self):
+        await self.request('a')
+        self.assertIs(await self.request('a', status=304), NOT_MODIFIED)
+        self.assertEqual(self.headers, {'If-None-Match': '"a"'})
+
+    async def test_validators_bounded(self):
+        for url in ('a', 'b', 'a', 'c'):
+            await self.request(url)
+        # The least recently stored URL is dropped first
+        self.assertEqual(list(self.session.validators), ['a', 'c'])
+
+
+if __name__ == '__main__':
+    unittest.main()
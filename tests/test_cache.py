@@ -0,0 +1,35 @@
+import os
+from tempfile import TemporaryDirectory
+import unittest
+
+from bin import TTLCache
+
+class TestTTLCache(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests of persisting a `TTLCache`.
+    """
+    async def test_save_and_load(self):
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache.json')
+            cache = TTLCache(path=path)
+            cache['a'] = ['thumb', 'title']
+            cache['b'] = None
+            await cache.save()
+            loaded = TTLCache(path=path)
+            self.assertIn('a', loaded)
+            self.assertEqual(loaded['a'], ['thumb', 'title'])
+            self.assertIn('b', loaded)
+            self.assertIsNone(loaded['b'])
+
+    async def test_save_failure_is_logged(self):
+        with TemporaryDirectory() as tmp:
+            cache = TTLCache(path=os.path.join(tmp, 'missing', 'cache.json'))
+            cache['a'] = 'value'
+            with self.assertLogs('bin.cache', 'WARNING'):
+                await cache.save()
+            # The entries stay cached
+            self.assertEqual(cache['a'], 'value')
+
+
+if __name__ == '__main__':
+    unittest.main()
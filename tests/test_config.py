@@ -0,0 +1,54 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+import unittest
+
+from bin import JSONConfig
+
+class TestJSONConfig(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests of `JSONConfig`.
+    """
+    async def asyncSetUp(self):
+        self.tmp = TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'config.json')
+        self.config = JSONConfig(self.path, {'items': []}, self.parse)
+
+    async def asyncTearDown(self):
+        self.tmp.cleanup()
+
+    @staticmethod
+    def parse(data: dict) -> tuple:
+        if not isinstance(data['items'], list):
+            raise ValueError('Invalid items')
+        return tuple(data['items'])
+
+    def write(self, data: str) -> None:
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(data)
+
+    async def test_creates_default(self):
+        self.assertEqual(await self.config.load(), ())
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {'items': []})
+
+    async def test_reloads_changes(self):
+        self.write('{"items": [1, 2]}')
+        self.assertEqual(await self.config.load(), (1, 2))
+        # Unchanged files aren't parsed again
+        snapshot = self.config.snapshot
+        self.assertIs(await self.config.load(), snapshot)
+        self.write('{"items": [1, 2, 3]}')
+        self.assertEqual(await self.config.load(), (1, 2, 3))
+
+    async def test_keeps_previous_when_invalid(self):
+        self.write('{"items": [1]}')
+        self.assertEqual(await self.config.load(), (1,))
+        self.write('{"items": ')
+        self.assertEqual(await self.config.load(), (1,))
+        self.write('{"items": 5}')
+        self.assertEqual(await self.config.load(), (1,))
+
+
+if __name__ == '__main__':
+    unittest.main()
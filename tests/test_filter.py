@@ -0,0 +1,171 @@
+from random import Random
+import sqlite3
+import unittest
+
+from bin.database._filter import Filter, FilterTable
+from tests.fake_pool import FakePool
+
+TABLES = FilterTable(
+    data_table='ll2_agencies',
+    filter_table='ll2_agencies_filter',
+    id_column='agency_id',
+    include_exclude_column='agencies_include_exclude',
+    name_column='name',
+    webhook_column='webhook_url'
+)
+
+# Guild ID: (include, filtered agency IDs)
+GUILDS = {1: (0, [10]), 2: (1, [10, 20]), 3: (0, [])}
+
+def respond(query: str, args) -> list[tuple]:
+    """
+    Answer the queries of the cached path.
+    """
+    if 'LEFT JOIN' in query:
+        guilds = [args[0]] if args else sorted(GUILDS)
+        return [
+            (guild, GUILDS[guild][0], agency_id, f'Agency {agency_id}')
+            for guild in guilds
+            for agency_id in GUILDS[guild][1] or [None]
+        ]
+    return [(guild, f'https://webhook/{guild}') for guild in GUILDS]
+
+class TestFilterCache(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests of the cached path of `Filter.filter_eligible_iter`.
+    """
+    async def asyncSetUp(self):
+        self.db = Filter()
+        self.db._filter_cache_ttl = 600
+        self.db.pool = FakePool(respond)
+
+    async def eligible(self, ids):
+        return [
+            row async for row in self.db.filter_eligible_iter(TABLES, ids=ids)
+        ]
+
+    async def test_loads_every_guild_at_once(self):
+        self.assertEqual(
+            await self.eligible([10, 20, None]),
+            [
+                (1, 'https://webhook/1', [False, True, True]),
+                (2, 'https://webhook/2', [True, True, False]),
+                (3, 'https://webhook/3', [True, True, True])
+            ]
+        )
+        # Guilds and their filters, not a query per guild
+        self.assertEqual(len(self.db.pool.queries), 2)
+
+        # Cached, only the guilds are queried
+        await self.eligible([10])
+        self.assertEqual(len(self.db.pool.queries), 3)
+
+    async def test_reloads_a_cleared_guild(self):
+        await self.eligible([10])
+        self.db.filter_cache_clear(TABLES, 2)
+        await self.eligible([10])
+        # Guilds, every filter, guilds and the filters of guild 2
+        self.assertEqual(len(self.db.pool.queries), 4)
+        self.assertEqual(self.db.pool.queries[-1][1], (2,))
+
+    async def test_expired(self):
+        await self.eligible([10])
+        self.db._filter_cache[TABLES.filter_table] = (
+            0, self.db._filter_cache[TABLES.filter_table][1]
+        )
+        await self.eligible([10])
+        self.assertEqual(len(self.db.pool.queries), 4)
+        self.assertIsNone(self.db.pool.queries[-1][1])
+
+
+class TestFilterEligible(unittest.IsolatedAsyncioTestCase):
+    """
+    Compares both paths of `Filter.filter_eligible_iter`
+    with the expected result, the queries run on SQLite.
+    """
+    async def asyncSetUp(self):
+        rng = Random(6)
+        self.sqlite = sqlite3.connect(':memory:')
+        self.sqlite.executescript(
+            """
+            CREATE TABLE enabled_guilds (
+                guild_id INTEGER PRIMARY KEY,
+                agencies_include_exclude INTEGER,
+                webhook_url TEXT
+            );
+            CREATE TABLE ll2_agencies (agency_id INTEGER PRIMARY KEY, name TEXT);
+            CREATE TABLE ll2_agencies_filter (guild_id INTEGER, agency_id INTEGER);
+            """
+        )
+        self.agencies = list(range(1, 81))
+        self.sqlite.executemany(
+            'INSERT INTO ll2_agencies VALUES (?, ?)',
+            [(i, f'Agency {i}') for i in self.agencies]
+        )
+        # Guild ID: (include, filtered agency IDs, webhook URL)
+        self.guilds = {}
+        for guild in range(1, 41):
+            self.guilds[guild] = (
+                rng.random() < 0.5,
+                set(rng.sample(self.agencies, rng.randint(0, 10))),
+                None if guild % 7 == 0 else f'https://webhook/{guild}'
+            )
+            include, filtered, webhook_url = self.guilds[guild]
+            self.sqlite.execute(
+                'INSERT INTO enabled_guilds VALUES (?, ?, ?)',
+                (guild, int(include), webhook_url)
+            )
+            self.sqlite.executemany(
+                'INSERT INTO ll2_agencies_filter VALUES (?, ?)',
+                [(guild, i) for i in filtered]
+            )
+
+        self.db = Filter()
+        self.db.pool = FakePool(
+            lambda query, args: self.sqlite.execute(
+                query.replace('%s', '?'), args or ()
+            ).fetchall()
+        )
+
+    async def asyncTearDown(self):
+        self.sqlite.close()
+
+    def expected(self, ids):
+        result = []
+        for guild, (include, filtered, webhook_url) in self.guilds.items():
+            eligible = [
+                (i in filtered) == include if i else not include
+                for i in ids
+            ]
+            if webhook_url and any(eligible):
+                result.append((guild, webhook_url, eligible))
+        return result
+
+    async def eligible(self, ids):
+        return sorted(
+            [row async for row in self.db.filter_eligible_iter(TABLES, ids=ids)]
+        )
+
+    async def test_bitmask_and_cache(self):
+        # More than 64 IDs to use two bitmask columns
+        ids = [*self.agencies[:70], None]
+        for ttl in (0, 600):
+            with self.subTest(ttl=ttl):
+                self.db._filter_cache_ttl = ttl
+                self.assertEqual(await self.eligible(ids), self.expected(ids))
+
+    async def test_bitmask_single_query(self):
+        self.db._filter_cache_ttl = 0
+        await self.eligible(self.agencies[:70])
+        self.assertEqual(len(self.db.pool.queries), 1)
+        self.assertIn('eligible_1', self.db.pool.queries[0][0])
+
+    async def test_no_values(self):
+        for ttl in (0, 600):
+            self.db._filter_cache_ttl = ttl
+            self.assertEqual(await self.eligible([]), [])
+        self.assertEqual(self.db.pool.queries, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
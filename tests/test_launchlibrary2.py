@@ -0,0 +1,246 @@
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+import unittest
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from bin import LaunchLibrary2, LL2Event, NOT_MODIFIED
+
+def launch(ll2_id: str, net: datetime) -> dict:
+    """
+    Launch of the LL2 API with the fields that are parsed.
+    """
+    return {
+        'id': ll2_id,
+        'name': f'Launch {ll2_id}',
+        'net': net.isoformat(),
+        'net_precision': None,
+        'status': {'id': 1},
+        'vid_urls': [],
+        'mission': None,
+        'image': None,
+        'webcast_live': False,
+        'slug': f'launch-{ll2_id}',
+        'flightclub_url': None,
+        'launch_service_provider': {'id': 121, 'name': 'SpaceX'},
+        'pad': {'location': {'name': 'Cape Canaveral'}}
+    }
+
+def event(ll2_id: int, date: datetime) -> dict:
+    """
+    Event of the LL2 API with the fields that are parsed.
+    """
+    return {
+        'id': ll2_id,
+        'name': f'Event {ll2_id}',
+        'date': date.isoformat(),
+        'date_precision': None,
+        'type': {'name': 'EVA'},
+        'duration': None,
+        'vid_urls': [],
+        'description': None,
+        'image': None,
+        'webcast_live': False,
+        'slug': f'event-{ll2_id}',
+        'location': 'ISS'
+    }
+
+class FakeLL2:
+    """
+    Pages of the upcoming launches and events
+    per URL path, recording the requested URLs.
+    """
+    def __init__(self, results: dict[str, list[dict]]) -> None:
+        self.results = results
+        self.urls = []
+
+    def __call__(self, url: str, **kwargs) -> dict:
+        self.urls.append(url)
+        parts = urlsplit(url)
+        query = parse_qs(parts.query)
+        limit = int(query['limit'][0])
+        offset = int(query.get('offset', [0])[0])
+        results = self.results[parts.path.split('/')[2]]
+        return {
+            'count': len(results),
+            'next': None,
+            'results': results[offset:offset + limit]
+        }
+
+class TestLL2Request(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests of `LaunchLibrary2.ll2_request`.
+    """
+    async def test_not_modified_reuses_parsed_page(self):
+        ll2 = LaunchLibrary2()
+        url = 'https://ll.thespacedevs.com/2.3.0/launches/upcoming/?limit=50'
+        page = {'count': 2, 'next': None, 'results': [{'id': 'a'}, {'id': 'b'}]}
+        parse = mock.Mock(side_effect=lambda entry: (entry['id'], entry))
+
+        with mock.patch('bin.launchlibrary2.get', side_effect=[page, NOT_MODIFIED]):
+            first = await ll2.ll2_request(url, parse=parse)
+            second = await ll2.ll2_request(url, parse=parse)
+
+        self.assertEqual(first['results'], [('a', {'id': 'a'}), ('b', {'id': 'b'})])
+        # The unchanged page isn't parsed again
+        self.assertIs(second, first)
+        self.assertEqual(parse.call_count, 2)
+
+
+class TestLL2Pages(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests of `LaunchLibrary2.ll2_pages`.
+    """
+    url = 'https://ll.thespacedevs.com/2.3.0/launches/upcoming/?limit=50'
+
+    async def pages(self, max_results: int | None) -> FakeLL2:
+        now = datetime.now(timezone.utc)
+        fake = FakeLL2({
+            'launches': [launch(str(i), now) for i in range(120)]
+        })
+        with mock.patch('bin.launchlibrary2.get', side_effect=fake):
+            results = [
+                page async for page in LaunchLibrary2().ll2_pages(
+                    self.url,
+                    max_results=max_results
+                )
+            ]
+        self.assertEqual(
+            sum(map(len, results)),
+            120 if max_results is None else 100
+        )
+        return fake
+
+    async def test_offsets(self):
+        fake = await self.pages(None)
+        self.assertEqual(
+            fake.urls,
+            [self.url, f'{self.url}&offset=50', f'{self.url}&offset=100']
+        )
+
+    async def test_max_results(self):
+        # Stops after the page containing the 64th result
+        fake = await self.pages(64)
+        self.assertEqual(fake.urls, [self.url, f'{self.url}&offset=50'])
+
+
+class TestLL2Ingest(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests of the incremental polls of `LaunchLibrary2`.
+    """
+    def setUp(self):
+        self.now = datetime.now(timezone.utc).replace(microsecond=0)
+        self.fake = FakeLL2({
+            'launches': [
+                launch(str(i), self.now + timedelta(days=i)) for i in range(80)
+            ],
+            'events': [
+                event(i, self.now + timedelta(days=i)) for i in range(10)
+            ]
+        })
+        self.ll2 = LaunchLibrary2()
+
+    async def upcoming(self, kind: str = '') -> dict[str, LL2Event]:
+        with mock.patch('bin.launchlibrary2.get', side_effect=self.fake):
+            return await getattr(self.ll2, f'upcoming{kind}')()
+
+    async def test_full_sync(self):
+        upcoming = await self.upcoming()
+
+        # Two pages of launches until the 64th and one page of events
+        self.assertEqual(len(self.fake.urls), 3)
+        self.assertEqual(self.ll2._ll2_poll_requests, 3)
+        self.assertEqual(len(upcoming), self.ll2.max_events)
+        self.assertEqual(
+            list(upcoming),
+            sorted(upcoming, key=lambda ll2_id: upcoming[ll2_id].start)
+        )
+
+    async def test_incremental_merge(self):
+        self.ll2.max_events = 3
+        await self.upcoming()
+        polled = self.ll2._polled['launches']
+        self.fake.urls.clear()
+
+        # Only a renamed launch and a new earlier launch changed
+        renamed = launch('1', self.now + timedelta(days=1))
+        renamed['name'] = 'Renamed'
+        self.fake.results['launches'] = [
+            launch('new', self.now - timedelta(hours=2)),
+            renamed
+        ]
+        launches = await self.upcoming('_launches')
+
+        url, = self.fake.urls
+        self.assertTrue(url.endswith(
+            (polled - self.ll2.ll2_poll_overlap).strftime(
+                '&last_updated__gte=%Y-%m-%dT%H:%M:%SZ'
+            )
+        ))
+        # Merged into the snapshot and truncated to `.max_events`
+        self.assertEqual(list(launches), ['new', '0', '1'])
+        self.assertEqual(launches['1'].name, 'Renamed')
+
+    async def test_resync(self):
+        await self.upcoming()
+        self.ll2._synced['launches'] -= self.ll2.ll2_resync_interval
+        self.fake.urls.clear()
+        # Removed launches are only noticed by a full sync
+        self.fake.results['launches'] = self.fake.results['launches'][1:]
+
+        launches = await self.upcoming('_launches')
+
+        self.assertNotIn('last_updated__gte', self.fake.urls[0])
+        self.assertNotIn('0', launches)
+
+
+class TestLL2PollInterval(unittest.TestCase):
+    """
+    Tests of `LaunchLibrary2.poll_interval`.
+    """
+    def setUp(self):
+        self.ll2 = LaunchLibrary2()
+        self.ll2.ll2_hourly_budget = 200
+        self.ll2._ll2_poll_requests = 3
+        now = datetime.now(timezone.utc)
+        self.upcoming = {
+            'a': LL2Event(
+                ll2_id='a',
+                name='Launch a',
+                status=1,
+                description=None,
+                url=None,
+                image_url=None,
+                start=now + timedelta(minutes=10),
+                end=now + timedelta(minutes=70),
+                webcast_live=False,
+                slug='launch-a',
+                flightclub=False
+            )
+        }
+
+    def test_budget_spread(self):
+        # 3 requests per poll within 200 requests per hour
+        self.assertEqual(self.ll2.poll_interval(self.upcoming), 54)
+
+    def test_fast_within_budget(self):
+        self.ll2.ll2_hourly_budget = 3600
+        self.assertEqual(
+            self.ll2.poll_interval(self.upcoming),
+            self.ll2.poll_intervals['fast']
+        )
+
+    def test_budget_used(self):
+        # The last hour used the budget, wait until
+        # enough requests left the one hour window
+        now = monotonic()
+        self.ll2._ll2_requests.extend(
+            [now - 3600 - 1] + [now - 3000] * 3 + [now - 10] * 197
+        )
+        interval = self.ll2.poll_interval(self.upcoming)
+        self.assertNotIn(now - 3600 - 1, self.ll2._ll2_requests)
+        self.assertAlmostEqual(interval, 600, delta=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
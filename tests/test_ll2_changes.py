@@ -0,0 +1,95 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+import unittest
+
+from bin import LL2Changeset, LL2Event
+
+START = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+
+def event(ll2_id: str, **fields) -> LL2Event:
+    """
+    Stored LL2 event with default data.
+    """
+    return replace(
+        LL2Event(
+            ll2_id=ll2_id,
+            name=f'Launch {ll2_id}',
+            status=1,
+            description=None,
+            url=None,
+            image_url=None,
+            start=START,
+            end=START + timedelta(hours=1),
+            webcast_live=False,
+            slug=f'launch-{ll2_id}',
+            flightclub=False,
+            agency_id=121
+        ),
+        **fields
+    )
+
+
+class TestLL2Changeset(unittest.TestCase):
+    """
+    Tests of `LL2Changeset.from_snapshots`.
+    """
+    def test_added_removed_unchanged(self):
+        cached = {'a': event('a'), 'b': event('b')}
+        # Parsed events have the agency name, which isn't stored
+        upcoming = {
+            'b': event('b', agency_name='SpaceX'),
+            'c': event('c')
+        }
+
+        changeset = LL2Changeset.from_snapshots(cached, upcoming)
+
+        self.assertEqual(changeset.added, (upcoming['c'],))
+        self.assertEqual(changeset.removed, (cached['a'],))
+        self.assertEqual(changeset.changed, ())
+        # The newer data of unchanged events is kept
+        self.assertEqual(changeset.unchanged, (upcoming['b'],))
+
+    def test_changed_fields(self):
+        cached = {'a': event('a')}
+        upcoming = {'a': event('a', name='Renamed', webcast_live=True)}
+
+        change, = LL2Changeset.from_snapshots(cached, upcoming).changed
+
+        self.assertIs(change.cached, cached['a'])
+        self.assertIs(change.new, upcoming['a'])
+        self.assertEqual(
+            dict(change.fields),
+            {'name': 'Renamed', 'webcast_live': True}
+        )
+        # Only the changed fields are set
+        self.assertIsNone(change.status)
+        self.assertIsNone(change.start)
+        # The fields can't be changed by a stage
+        with self.assertRaises(TypeError):
+            change.fields['name'] = 'Other'
+
+    def test_status_transition(self):
+        cached = {'a': event('a')}
+        upcoming = {'a': event('a', status=3)}
+
+        change, = LL2Changeset.from_snapshots(cached, upcoming).changed
+
+        self.assertEqual(change.status, (1, 3))
+        self.assertIsNone(change.start)
+
+    def test_start_moved(self):
+        new_start = START + timedelta(days=1)
+        cached = {'a': event('a')}
+        upcoming = {
+            'a': event('a', start=new_start, end=new_start + timedelta(hours=1))
+        }
+
+        change, = LL2Changeset.from_snapshots(cached, upcoming).changed
+
+        self.assertEqual(change.start, (START, new_start))
+        self.assertIsNone(change.status)
+        self.assertEqual(set(change.fields), {'start', 'end'})
+
+
+if __name__ == '__main__':
+    unittest.main()
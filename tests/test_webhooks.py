@@ -0,0 +1,34 @@
+import unittest
+
+from bin import combine_embeds
+
+class TestCombineEmbeds(unittest.TestCase):
+    """
+    Tests of `combine_embeds`, strings stand in
+    for embeds since only their length is used.
+    """
+    def test_limits(self):
+        self.assertEqual(combine_embeds([]), [])
+        self.assertEqual(
+            combine_embeds(['a'] * 11),
+            [['a'] * 10, ['a']]
+        )
+        self.assertEqual(
+            combine_embeds(['a' * 3000, 'b' * 3000, 'c']),
+            [['a' * 3000, 'b' * 3000], ['c']]
+        )
+
+    def test_oversized(self):
+        big = 'a' * 7000
+        # Never an empty batch, the embed is sent on its own
+        self.assertEqual(combine_embeds([big]), [[big]])
+        self.assertEqual(
+            combine_embeds(['b', big, 'c']),
+            [['b'], [big], ['c']]
+        )
+        for batch in combine_embeds([big, big, 'b']):
+            self.assertTrue(batch)
+
+
+if __name__ == '__main__':
+    unittest.main()
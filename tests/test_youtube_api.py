@@ -0,0 +1,72 @@
+import os
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from bin import YouTubeAPI
+
+class TestYouTubeAPI(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests of the quota handling of `YouTubeAPI`.
+    """
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {
+            'YOUTUBE_CACHE_PATH': os.path.join(self.tmp.name, 'cache.json'),
+            'YOUTUBE_QUOTA_PATH': os.path.join(self.tmp.name, 'quota.json')
+        })
+        self.env.start()
+        self.api = YouTubeAPI()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def videos(self, found):
+        """
+        Respond to video requests, only `found` IDs exist.
+        """
+        async def get(url, **kwargs):
+            ids = parse_qs(urlsplit(url).query)['id'][0].split(',')
+            return {
+                'items': [
+                    {'id': id, 'snippet': {'channelId': f'channel-{id}'}}
+                    for id in ids if id in found
+                ]
+            }
+        return mock.patch('bin.youtube_api.get', side_effect=get)
+
+    async def test_not_found_is_not_deferred(self):
+        with self.videos({'a'}):
+            channels, deferred = await self.api.get_channels_from_videos(['a', 'b'])
+        self.assertEqual(channels, {'a': 'channel-a'})
+        self.assertEqual(deferred, [])
+
+    async def test_deferred_when_quota_used(self):
+        self.api.quota_used = {'videos': self.api.quota_limit}
+        ids = [f'video{i:02}' for i in range(60)]
+        with self.videos(set(ids)) as request:
+            channels, deferred = await self.api.get_channels_from_videos(ids)
+        request.assert_not_called()
+        self.assertEqual(channels, {})
+        self.assertEqual(deferred, ids)
+
+    async def test_deferred_batches(self):
+        # Room for one request of 50 videos, not for two
+        self.api.quota_used = {'videos': self.api.quota_limit - 1}
+        ids = [f'video{i:02}' for i in range(60)]
+        with self.videos(set(ids)) as request:
+            _, deferred = await self.api.get_channels_from_videos(ids)
+        request.assert_not_called()
+        self.assertEqual(deferred, ids)
+
+    async def test_quota_kept_across_restarts(self):
+        self.api.quota_used = {'channels': 3}
+        with self.videos({'a'}):
+            await self.api.get_channels_from_videos(['a'])
+        self.assertEqual(YouTubeAPI().quota_used, {'channels': 3, 'videos': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
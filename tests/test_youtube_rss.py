@@ -0,0 +1,102 @@
+from pathlib import Path
+import unittest
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+from bin import NOT_MODIFIED, shared_session, YouTubeRSS
+
+# YouTube RSS feed with 15 entries, the amount YouTube returns
+FIXTURE = Path(__file__).parent / 'fixtures' / 'youtube_rss_feed.xml'
+
+def parse_bs4(feed: bytes) -> list[tuple[str, str, str, str]]:
+    """
+    Previous BeautifulSoup parser of `YouTubeRSS`,
+    kept as a reference for `YouTubeRSS._parseRSS`.
+    """
+    soup = BeautifulSoup(feed.decode('utf-8'), features='xml')
+    return [
+        (
+            entry.find('yt:videoId').string,
+            entry.title.text,
+            entry.published.text,
+            entry.updated.text
+        )
+        for entry in soup.find_all('entry')
+    ]
+
+class TestParseRSS(unittest.TestCase):
+    """
+    Tests of `YouTubeRSS._parseRSS`.
+    """
+    def test_matches_bs4(self):
+        feed = FIXTURE.read_bytes()
+        entries = list(YouTubeRSS()._parseRSS(feed))
+        self.assertEqual(len(entries), 15)
+        self.assertEqual(entries, parse_bs4(feed))
+        # Entities and non-ASCII titles are decoded
+        self.assertEqual(entries[2][1], 'Europa Clipper Launch <LIVE>')
+        self.assertEqual(entries[0][1][:6], 'NASA’s')
+
+
+class TestChannelBroadcasts(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests of `YouTubeRSS._get_channel_broadcastsRSS`.
+    """
+    channel = 'UCLA_DiR1FfKNvjuUpBHmylQ'
+
+    def setUp(self):
+        self.rss = YouTubeRSS()
+        self.feed = FIXTURE.read_text(encoding='utf-8')
+
+    def configure(self, keywords, ignore=()):
+        self.rss.config = self.rss._parse_channel_list({
+            'channels': [self.channel],
+            'keywords': {self.channel: list(keywords)},
+            'ignore': {self.channel: list(ignore)},
+            'agency_ids': {}
+        })
+
+    async def broadcasts(self):
+        # The fixture is older than the default two days
+        return await self.rss._get_channel_broadcastsRSS(
+            self.channel,
+            maxdaysago=100000
+        )
+
+    async def test_not_modified_uses_current_keywords(self):
+        self.configure(['launch'], ['Roscosmos'])
+        with mock.patch(
+            'bin.youtube_rss.get',
+            side_effect=[self.feed, NOT_MODIFIED, NOT_MODIFIED]
+        ) as get:
+            self.assertEqual(
+                await self.broadcasts(),
+                ['Xq00LfB7sAw', 'Xq02LfB7sAw', 'Xq08LfB7sAw']
+            )
+            # Unchanged feed, same result
+            self.assertEqual(
+                await self.broadcasts(),
+                ['Xq00LfB7sAw', 'Xq02LfB7sAw', 'Xq08LfB7sAw']
+            )
+            # Changed keywords apply to the unchanged feed
+            self.configure(['spacewalk'])
+            self.assertEqual(await self.broadcasts(), ['Xq03LfB7sAw'])
+        self.assertEqual(get.call_count, 3)
+
+    async def test_not_modified_without_entries(self):
+        self.configure(['launch'])
+        url = self.rss._feed_url % self.channel
+        shared_session.validators[url] = ('"etag"', None)
+        with mock.patch(
+            'bin.youtube_rss.get',
+            side_effect=[NOT_MODIFIED, self.feed]
+        ) as get:
+            # Validators without kept entries, requested in full
+            self.assertEqual(len(await self.broadcasts()), 4)
+        self.assertEqual(get.call_count, 2)
+        self.assertNotIn(url, shared_session.validators)
+
+
+if __name__ == '__main__':
+    unittest.main()